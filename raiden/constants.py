@@ -1,14 +1,15 @@
-import math
-from enum import Enum
+import re
+from enum import Enum, IntEnum
 
-from eth_utils import keccak, to_canonical_address, to_checksum_address
+from typing_extensions import Final
 
-from raiden.utils.secrethash import sha256_secrethash
 from raiden.utils.typing import (
     AdditionalHash,
+    AddressHex,
     BalanceHash,
     BlockHash,
     BlockNumber,
+    Dict,
     Locksroot,
     RaidenDBVersion,
     RaidenProtocolVersion,
@@ -20,118 +21,147 @@ from raiden.utils.typing import (
     TransactionHash,
 )
 
-LATEST = "https://api.github.com/repos/raiden-network/raiden/releases/latest"
-RELEASE_PAGE = "https://github.com/raiden-network/raiden/releases"
-SECURITY_EXPRESSION = r"\[CRITICAL UPDATE.*?\]"
+LATEST: Final = "https://api.github.com/repos/raiden-network/raiden/releases/latest"
+RELEASE_PAGE: Final = "https://github.com/raiden-network/raiden/releases"
+SECURITY_EXPRESSION: Final = re.compile(r"\[CRITICAL UPDATE.*?\]")
 
-RAIDEN_DB_VERSION = RaidenDBVersion(23)
-SQLITE_MIN_REQUIRED_VERSION = (3, 9, 0)
-PROTOCOL_VERSION = RaidenProtocolVersion(1)
+RAIDEN_DB_VERSION: Final = RaidenDBVersion(23)
+# Same encoding as SQLITE_VERSION_NUMBER, major * 1_000_000 + minor * 1_000 + patch
+SQLITE_MIN_REQUIRED_VERSION: Final = 3_009_000
+PROTOCOL_VERSION: Final = RaidenProtocolVersion(1)
 
-UINT256_MAX = 2 ** 256 - 1
-UINT64_MAX = 2 ** 64 - 1
+# 2 ** 256 - 1 and 2 ** 64 - 1
+UINT256_MAX: Final = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF
+UINT64_MAX: Final = 0xFFFFFFFFFFFFFFFF
 
-SECONDS_PER_DAY = 24 * 60 * 60
+SECONDS_PER_DAY: Final = 24 * 60 * 60
+
+GENESIS_BLOCK_NUMBER: Final = BlockNumber(0)
+
+
+class Networks(IntEnum):
+    MAINNET = 1
+    ROPSTEN = 3
+    RINKEBY = 4
+    GOERLI = 5
+    KOVAN = 42
+    SMOKETEST = 627
 
-GENESIS_BLOCK_NUMBER = BlockNumber(0)
 
 # Relevant forks:
 # BYZANTIUM https://eips.ethereum.org/EIPS/eip-609
 # CONSTANTINOPLE https://eips.ethereum.org/EIPS/eip-1013
+#
+# Indexed by chain id, since `Networks` is an `IntEnum` a plain chain id can be used as key.
+FORKS: Final[Dict[int, Dict[str, BlockNumber]]] = {
+    Networks.MAINNET: {
+        "BYZANTIUM": BlockNumber(4_370_000),
+        "CONSTANTINOPLE": BlockNumber(7_280_000),
+    },
+    Networks.ROPSTEN: {
+        "BYZANTIUM": BlockNumber(1_700_000),
+        "CONSTANTINOPLE": BlockNumber(4_230_000),
+    },
+    Networks.KOVAN: {"BYZANTIUM": BlockNumber(0), "CONSTANTINOPLE": BlockNumber(4_230_000)},
+    Networks.RINKEBY: {"BYZANTIUM": BlockNumber(0), "CONSTANTINOPLE": BlockNumber(3_660_663)},
+    Networks.GOERLI: {"BYZANTIUM": BlockNumber(0), "CONSTANTINOPLE": BlockNumber(0)},
+}
 
 
-class EthereumForks(Enum):
-    BYZANTIUM = BlockNumber(4_370_000)
-    CONSTANTINOPLE = BlockNumber(7_280_000)
+# Deprecated, use `FORKS` instead. Kept for backwards compatibility.
+class EthereumForks:
+    BYZANTIUM = FORKS[Networks.MAINNET]["BYZANTIUM"]
+    CONSTANTINOPLE = FORKS[Networks.MAINNET]["CONSTANTINOPLE"]
 
 
-class RopstenForks(Enum):
-    BYZANTIUM = BlockNumber(1_700_000)
-    CONSTANTINOPLE = BlockNumber(4_230_000)
+class RopstenForks:
+    BYZANTIUM = FORKS[Networks.ROPSTEN]["BYZANTIUM"]
+    CONSTANTINOPLE = FORKS[Networks.ROPSTEN]["CONSTANTINOPLE"]
 
 
-class KovanForks(Enum):
-    BYZANTIUM = BlockNumber(0)
-    CONSTANTINOPLE = BlockNumber(4_230_000)
+class KovanForks:
+    BYZANTIUM = FORKS[Networks.KOVAN]["BYZANTIUM"]
+    CONSTANTINOPLE = FORKS[Networks.KOVAN]["CONSTANTINOPLE"]
 
 
-class RinkebyForks(Enum):
-    BYZANTIUM = BlockNumber(0)
-    CONSTANTINOPLE = BlockNumber(3_660_663)
+class RinkebyForks:
+    BYZANTIUM = FORKS[Networks.RINKEBY]["BYZANTIUM"]
+    CONSTANTINOPLE = FORKS[Networks.RINKEBY]["CONSTANTINOPLE"]
 
 
-class GoerliForks(Enum):
-    BYZANTIUM = BlockNumber(0)
-    CONSTANTINOPLE = BlockNumber(0)
-
-
-class Networks(Enum):
-    MAINNET = 1
-    ROPSTEN = 3
-    RINKEBY = 4
-    GOERLI = 5
-    KOVAN = 42
-    SMOKETEST = 627
+class GoerliForks:
+    BYZANTIUM = FORKS[Networks.GOERLI]["BYZANTIUM"]
+    CONSTANTINOPLE = FORKS[Networks.GOERLI]["CONSTANTINOPLE"]
 
 
 # Set at 64 since parity's default is 64 and Geth's default is 128
 # TODO: Make this configurable. Since in parity this is also a configurable value
-STATE_PRUNING_AFTER_BLOCKS = 64
-STATE_PRUNING_SAFETY_MARGIN = 8
-NO_STATE_QUERY_AFTER_BLOCKS = STATE_PRUNING_AFTER_BLOCKS - STATE_PRUNING_SAFETY_MARGIN
-
-NULL_ADDRESS_BYTES = bytes(20)
-NULL_ADDRESS = to_checksum_address(NULL_ADDRESS_BYTES)
-
-EMPTY_HASH = BlockHash(bytes(32))
-EMPTY_TRANSACTION_HASH = TransactionHash(bytes(32))
-EMPTY_BALANCE_HASH = BalanceHash(bytes(32))
-EMPTY_MESSAGE_HASH = AdditionalHash(bytes(32))
-EMPTY_SIGNATURE = Signature(bytes(65))
-EMPTY_SECRET = Secret(bytes(32))
-EMPTY_SECRETHASH = SecretHash(bytes(32))
-EMPTY_SECRET_SHA256 = sha256_secrethash(EMPTY_SECRET)
-LOCKSROOT_OF_NO_LOCKS = Locksroot(keccak(b""))
-ZERO_TOKENS = TokenAmount(0)
+STATE_PRUNING_AFTER_BLOCKS: Final = 64
+STATE_PRUNING_SAFETY_MARGIN: Final = 8
+NO_STATE_QUERY_AFTER_BLOCKS: Final = STATE_PRUNING_AFTER_BLOCKS - STATE_PRUNING_SAFETY_MARGIN
+
+NULL_ADDRESS_BYTES: Final = b"\x00" * 20
+# The EIP-55 checksum of the zero address is the address itself, there are no letters in it
+NULL_ADDRESS: Final = AddressHex("0x0000000000000000000000000000000000000000")
+
+# A single shared buffer for all the 32 bytes long empty values
+_ZERO32 = b"\x00" * 32
+
+EMPTY_HASH: Final = BlockHash(_ZERO32)
+EMPTY_TRANSACTION_HASH: Final = TransactionHash(_ZERO32)
+EMPTY_BALANCE_HASH: Final = BalanceHash(_ZERO32)
+EMPTY_MESSAGE_HASH: Final = AdditionalHash(_ZERO32)
+EMPTY_SIGNATURE: Final = Signature(b"\x00" * 65)
+EMPTY_SECRET: Final = Secret(_ZERO32)
+EMPTY_SECRETHASH: Final = SecretHash(_ZERO32)
+# sha256(EMPTY_SECRET) and keccak(b""), precomputed to avoid hashing at import time
+EMPTY_SECRET_SHA256: Final = SecretHash(
+    bytes.fromhex("66687aadf862bd776c8fc18b8e9f8e20089714856ee233b3902a591d0d5f2925")
+)
+LOCKSROOT_OF_NO_LOCKS: Final = Locksroot(
+    bytes.fromhex("c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470")
+)
+ZERO_TOKENS: Final = TokenAmount(0)
 
-ABSENT_SECRET = Secret(b"")
+ABSENT_SECRET: Final = Secret(b"")
 
-SECRET_LENGTH = 32
-SECRETHASH_LENGTH = 32
+SECRET_LENGTH: Final = 32
+SECRETHASH_LENGTH: Final = 32
 
-RECEIPT_FAILURE_CODE = 0
+RECEIPT_FAILURE_CODE: Final = 0
 
 
-class EthClient(Enum):
+class EthClient(str, Enum):
     GETH = "geth"
     PARITY = "parity"
 
 
-SNAPSHOT_STATE_CHANGES_COUNT = 500
+SNAPSHOT_STATE_CHANGES_COUNT: Final = 500
 
 # An arbitrary limit for transaction size in Raiden, added in PR #1990
-TRANSACTION_GAS_LIMIT_UPPER_BOUND = int(0.4 * 3_141_592)
+# 40% of 3_141_592, computed with integers only
+TRANSACTION_GAS_LIMIT_UPPER_BOUND: Final = (3_141_592 * 2) // 5
 
 # Used to add a 30% security margin to gas estimations in case the calculations are off
-GAS_FACTOR = 1.3
+GAS_FACTOR: Final = 1.3
 
 # The more pending transfers there are, the more computationally complex
 # it becomes to unlock them. Lest an unlocking operation fails because
 # not enough gas is available, we define a gas limit for unlock calls
 # and limit the number of pending transfers per channel so it is not
 # exceeded. The limit is inclusive.
-UNLOCK_TX_GAS_LIMIT = TRANSACTION_GAS_LIMIT_UPPER_BOUND
-MAXIMUM_PENDING_TRANSFERS = 160
+UNLOCK_TX_GAS_LIMIT: Final = TRANSACTION_GAS_LIMIT_UPPER_BOUND
+MAXIMUM_PENDING_TRANSFERS: Final = 160
 
 
-class Environment(Enum):
+class Environment(str, Enum):
     """Environment configurations that can be chosen on the command line."""
 
     PRODUCTION = "production"
     DEVELOPMENT = "development"
 
 
-class RoutingMode(Enum):
+class RoutingMode(str, Enum):
     """Routing mode configuration that can be chosen on the command line"""
 
     PFS = "pfs"
@@ -139,39 +169,38 @@ class RoutingMode(Enum):
     PRIVATE = "private"
 
 
-GAS_REQUIRED_PER_SECRET_IN_BATCH = math.ceil(UNLOCK_TX_GAS_LIMIT / MAXIMUM_PENDING_TRANSFERS)
-GAS_LIMIT_FOR_TOKEN_CONTRACT_CALL = 100_000
+# Integer ceiling division, exact regardless of the size of the operands
+GAS_REQUIRED_PER_SECRET_IN_BATCH: Final = -(-UNLOCK_TX_GAS_LIMIT // MAXIMUM_PENDING_TRANSFERS)
+GAS_LIMIT_FOR_TOKEN_CONTRACT_CALL: Final = 100_000
 
-CHECK_RDN_MIN_DEPOSIT_INTERVAL = 5 * 60
-CHECK_GAS_RESERVE_INTERVAL = 5 * 60
-CHECK_VERSION_INTERVAL = 3 * 60 * 60
-CHECK_NETWORK_ID_INTERVAL = 5 * 60
+CHECK_RDN_MIN_DEPOSIT_INTERVAL: Final = 5 * 60
+CHECK_GAS_RESERVE_INTERVAL: Final = 5 * 60
+CHECK_VERSION_INTERVAL: Final = 3 * 60 * 60
+CHECK_NETWORK_ID_INTERVAL: Final = 5 * 60
 
-DEFAULT_HTTP_REQUEST_TIMEOUT = 1.0  # seconds
+DEFAULT_HTTP_REQUEST_TIMEOUT: Final = 1  # seconds, an integer so no float conversion is needed
 
-DISCOVERY_DEFAULT_ROOM = "discovery"
-MONITORING_BROADCASTING_ROOM = "monitoring"
-PATH_FINDING_BROADCASTING_ROOM = "path_finding"
+DISCOVERY_DEFAULT_ROOM: Final = "discovery"
+MONITORING_BROADCASTING_ROOM: Final = "monitoring"
+PATH_FINDING_BROADCASTING_ROOM: Final = "path_finding"
 
 # According to the smart contracts as of 07/08:
 # https://github.com/raiden-network/raiden-contracts/blob/fff8646ebcf2c812f40891c2825e12ed03cc7628/raiden_contracts/contracts/TokenNetwork.sol#L213
 # channel_identifier can never be 0. We make this a requirement in the client and use this fact
 # to signify that a channel_identifier of `0` passed to the messages adds them to the
 # global queue
-EMPTY_ADDRESS = b"\0" * 20
+EMPTY_ADDRESS: Final = NULL_ADDRESS_BYTES
 
 
 # Keep in sync with .circleci/config.yaml
-HIGHEST_SUPPORTED_GETH_VERSION = "1.9.2"
-LOWEST_SUPPORTED_GETH_VERSION = "1.8.21"
+HIGHEST_SUPPORTED_GETH_VERSION: Final = "1.9.2"
+LOWEST_SUPPORTED_GETH_VERSION: Final = "1.8.21"
 # this is the last stable version as of this comment
-HIGHEST_SUPPORTED_PARITY_VERSION = "2.5.5"
-LOWEST_SUPPORTED_PARITY_VERSION = "1.7.6"
+HIGHEST_SUPPORTED_PARITY_VERSION: Final = "2.5.5"
+LOWEST_SUPPORTED_PARITY_VERSION: Final = "1.7.6"
 
 
-WETH_TOKEN_ADDRESS = TokenAddress(
-    to_canonical_address("0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2")
-)
-DAI_TOKEN_ADDRESS = TokenAddress(
-    to_canonical_address("0x89d24A6b4CcB1B6fAA2625fE562bDD9a23260359")
-)
+# 0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2
+WETH_TOKEN_ADDRESS: Final = TokenAddress(bytes.fromhex("c02aaa39b223fe8d0a0e5c4f27ead9083c756cc2"))
+# 0x89d24A6b4CcB1B6fAA2625fE562bDD9a23260359
+DAI_TOKEN_ADDRESS: Final = TokenAddress(bytes.fromhex("89d24a6b4ccb1b6faa2625fe562bdd9a23260359"))
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import lru_cache
 
 from eth_utils import to_hex
 
@@ -8,6 +9,17 @@ from raiden.utils.signer import Signer, recover
 from raiden.utils.typing import Address, ClassVar, MessageID, Optional, Signature
 
 
+@lru_cache(maxsize=1024)
+def _recover_sender(data: bytes, signature: Signature) -> Optional[Address]:
+    """ Cached signer recovery, `SignedMessage.sender` is read several times while a received
+    message is validated and handled, and the recovery is an expensive EC operation.
+    """
+    try:
+        return recover(data=data, signature=signature)
+    except InvalidSignature:
+        return None
+
+
 @dataclass(repr=False, eq=False)
 class Message:
     # Needs to be set by a subclass
@@ -59,16 +71,8 @@ class SignedMessage(AuthenticatedMessage):
     def sender(self) -> Optional[Address]:
         if not self.signature:
             return None
-        data_that_was_signed = self._data_to_sign()
-        message_signature = self.signature
-
-        try:
-            address: Optional[Address] = recover(
-                data=data_that_was_signed, signature=message_signature
-            )
-        except InvalidSignature:
-            address = None
-        return address
+        # The cache is keyed by the signed data, so changes to the message are picked up
+        return _recover_sender(self._data_to_sign(), self.signature)
 
 
 @dataclass(repr=False, eq=False)
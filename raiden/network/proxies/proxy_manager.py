@@ -125,8 +125,8 @@ class ProxyManager:
         current_block = self.client.block_number()
 
         while current_block < target_block_number:
-            current_block = self.client.block_number()
             gevent.sleep(0.5)
+            current_block = self.client.block_number()
 
         return current_block
 
@@ -523,6 +523,14 @@ class GMatrixClient(MatrixClient):
         self.sync_filter = json.dumps({"room": {"timeline": {"limit": limit}}})
         return prev_limit
 
+    def initial_sync(self) -> None:
+        """ Sync once without timeline events, restoring the previous events limit afterwards """
+        prev_sync_limit = self.set_sync_limit(0)
+        try:
+            self._sync()
+        finally:
+            self.set_sync_limit(prev_sync_limit)
+
 
 # Monkey patch matrix User class to provide nicer repr
 @wraps(User.__repr__)
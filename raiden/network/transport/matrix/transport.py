@@ -1,27 +1,27 @@
 import json
+import re
 import time
+from bisect import bisect_right
 from collections import defaultdict
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from itertools import groupby, islice
+from typing import TYPE_CHECKING, Pattern
 from urllib.parse import urlparse
 from uuid import uuid4
 
 import gevent
+import gevent.pool
 import structlog
 from eth_utils import is_binary_address, to_checksum_address, to_normalized_address
 from gevent.event import Event
 from gevent.lock import Semaphore
-from gevent.queue import JoinableQueue
+from gevent.queue import Empty, JoinableQueue
 from matrix_client.errors import MatrixRequestError
 
 from raiden.constants import DISCOVERY_DEFAULT_ROOM, EMPTY_SIGNATURE
 from raiden.exceptions import TransportError
 from raiden.message_handler import MessageHandler
-from raiden.messages.abstract import (
-    Message,
-    RetrieableMessage,
-    SignedMessage,
-    SignedRetrieableMessage,
-)
+from raiden.messages.abstract import Message, RetrieableMessage, SignedRetrieableMessage
 from raiden.messages.healthcheck import Ping, Pong
 from raiden.messages.matrix import ToDevice
 from raiden.messages.synchronization import Delivered, Processed
@@ -38,10 +38,18 @@ from raiden.network.transport.matrix.utils import (
     validate_and_parse_message,
     validate_userid_signature,
 )
-from raiden.network.transport.utils import timeout_exponential_backoff
+from raiden.network.transport.utils import (
+    timeout_exponential_backoff,
+    timeout_exponential_backoff_schedule,
+    timeout_jitter,
+)
 from raiden.storage.serialization.serializer import MessageSerializer
 from raiden.transfer import views
-from raiden.transfer.identifiers import CANONICAL_IDENTIFIER_GLOBAL_QUEUE, QueueIdentifier
+from raiden.transfer.identifiers import (
+    CANONICAL_IDENTIFIER_GLOBAL_QUEUE,
+    CanonicalIdentifier,
+    QueueIdentifier,
+)
 from raiden.transfer.state import NetworkState, QueueIdsToQueues
 from raiden.transfer.state_change import (
     ActionChangeNodeNetworkState,
@@ -55,13 +63,14 @@ from raiden.utils.typing import (
     Any,
     Callable,
     ChainID,
+    ChecksumAddress,
     Dict,
     Iterable,
     Iterator,
     List,
-    NamedTuple,
     NewType,
     Optional,
+    Set,
     Tuple,
     Union,
     cast,
@@ -76,94 +85,157 @@ _RoomID = NewType("_RoomID", str)
 # Combined with 10 retries (``..utils.JOIN_RETRIES``) this will give a total wait time of ~15s
 ROOM_JOIN_RETRY_INTERVAL = 0.1
 ROOM_JOIN_RETRY_INTERVAL_MULTIPLIER = 1.55
+# Delays between the attempts to join a room we were invited to
+INVITE_JOIN_RETRY_INTERVAL = 0.1
+INVITE_JOIN_RETRY_MAXIMUM = 10.0
+# Maximum relative deviation applied to the retry delays of requests to the homeserver
+RETRY_JITTER = 0.5
+# Maximum number of global messages taken from the queue and sent in one go
+GLOBAL_SEND_CHUNK_SIZE = 256
+# Maximum number of concurrent requests to the homeserver done by a health check
+HEALTH_CHECK_POOL_SIZE = 16
+
+
+@lru_cache(maxsize=4096)
+def _checksum_address(address: Address) -> ChecksumAddress:
+    """ Cached `to_checksum_address`, peer addresses are checksummed for most log entries and
+    account data lookups, and checksumming hashes the address with keccak each time.
+    """
+    return to_checksum_address(address)
 
 
 class _RetryQueue(Runnable):
     """ A helper Runnable to send batched messages to receiver through transport """
 
-    class _MessageData(NamedTuple):
+    class _MessageData:
         """ Small helper data structure for message queue """
 
-        queue_identifier: QueueIdentifier
-        message: Message
-        text: str
-        # generator that tells if the message should be sent now
-        expiration_generator: Iterator[bool]
+        __slots__ = ("queue_identifier", "message", "text", "expiration_generator")
+
+        def __init__(
+            self,
+            queue_identifier: QueueIdentifier,
+            message: Message,
+            text: str,
+            expiration_generator: Iterator[bool],
+        ):
+            self.queue_identifier = queue_identifier
+            self.message = message
+            self.text = text
+            # iterator that tells if the message should be sent now
+            self.expiration_generator = expiration_generator
 
     def __init__(self, transport: "MatrixTransport", receiver: Address):
         self.transport = transport
         self.receiver = receiver
+        # Used for logging, computed once since checksumming requires hashing the address
+        self._receiver_checksum = _checksum_address(receiver)
+        self._receiver_normalized = to_normalized_address(receiver)
+        # Kept sorted by channel (so global/unordered queue goes first), inside a queue messages
+        # are kept in the order in which they were enqueued. `_message_queue_order` holds the
+        # sort keys, in lockstep with `_message_queue`.
         self._message_queue: List[_RetryQueue._MessageData] = list()
+        self._message_queue_order: List[CanonicalIdentifier] = list()
+        # Index of the queued (queue_identifier, serialized message) pairs, to detect duplicates
+        # in O(1). The serialized text is used since not all messages are hashable.
+        self._queued_keys: Set[Tuple[QueueIdentifier, str]] = set()
         self._notify_event = gevent.event.Event()
         self._lock = gevent.lock.Semaphore()
         super().__init__()
-        self.greenlet.name = f"RetryQueue recipient:{to_checksum_address(self.receiver)}"
+        self.greenlet.name = f"RetryQueue recipient:{self._receiver_checksum}"
 
     @property
     def log(self):
         return self.transport.log
 
-    @staticmethod
-    def _expiration_generator(
-        timeout_generator: Iterable[float], now: Callable[[], float] = time.time
-    ) -> Iterator[bool]:
-        """Stateful generator that yields True if more than timeout has passed since previous True,
+    class _Expiration:
+        """Stateful iterator that yields True if more than timeout has passed since previous True,
         False otherwise.
 
-        Helper method to tell when a message needs to be retried (more than timeout seconds
-        passed since last time it was sent).
-        timeout is iteratively fetched from timeout_generator
+        Helper to tell when a message needs to be retried (more than timeout seconds passed
+        since last time it was sent).
+        timeout is iteratively read from schedule, whose last value is used indefinitely. The
+        schedule is shared by all the messages of a queue, so no generators are created per
+        message.
         First value is True to always send message at least once
         """
-        for timeout in timeout_generator:
-            _next = now() + timeout  # next value is now + next generated timeout
-            yield True
-            while now() < _next:  # yield False while next is still in the future
-                yield False
+
+        __slots__ = ("_schedule", "_index", "_next", "_now")
+
+        def __init__(self, schedule: Tuple[float, ...], now: Callable[[], float] = time.time):
+            self._schedule = schedule
+            self._index = 0
+            self._next = 0.0
+            self._now = now
+
+        def __iter__(self) -> Iterator[bool]:
+            return self
+
+        def __next__(self) -> bool:
+            now = self._now()
+            if now < self._next:  # yield False while next is still in the future
+                return False
+
+            # next value is now + next timeout of the schedule
+            self._next = now + self._schedule[self._index]
+            if self._index < len(self._schedule) - 1:
+                self._index += 1
+            return True
 
     def enqueue(self, queue_identifier: QueueIdentifier, message: Message):
         """ Enqueue a message to be sent, and notify main loop """
-        assert queue_identifier.recipient == self.receiver
+        self.enqueue_many([(queue_identifier, message)])
+
+    def enqueue_many(self, messages: List[Tuple[QueueIdentifier, Message]]):
+        """ Enqueue several messages to be sent, and notify main loop only once """
+        enqueued = False
         with self._lock:
-            already_queued = any(
-                queue_identifier == data.queue_identifier and message == data.message
-                for data in self._message_queue
-            )
-            if already_queued:
-                self.log.warning(
-                    "Message already in queue - ignoring",
-                    receiver=to_checksum_address(self.receiver),
-                    queue=queue_identifier,
-                    message=message,
-                )
-                return
-            timeout_generator = timeout_exponential_backoff(
-                self.transport._config["retries_before_backoff"],
-                self.transport._config["retry_interval"],
-                self.transport._config["retry_interval"] * 10,
-            )
-            expiration_generator = self._expiration_generator(timeout_generator)
-            self._message_queue.append(
-                _RetryQueue._MessageData(
-                    queue_identifier=queue_identifier,
-                    message=message,
-                    text=MessageSerializer.serialize(message),
-                    expiration_generator=expiration_generator,
+            for queue_identifier, message in messages:
+                assert queue_identifier.recipient == self.receiver
+                text = MessageSerializer.serialize(message)
+                if (queue_identifier, text) in self._queued_keys:
+                    self.log.warning(
+                        "Message already in queue - ignoring",
+                        receiver=self._receiver_checksum,
+                        queue=queue_identifier,
+                        message=message,
+                    )
+                    continue
+                expiration_generator = _RetryQueue._Expiration(self.transport._retry_schedule)
+                canonical_identifier = queue_identifier.canonical_identifier
+                index = bisect_right(self._message_queue_order, canonical_identifier)
+                self._message_queue.insert(
+                    index,
+                    _RetryQueue._MessageData(
+                        queue_identifier=queue_identifier,
+                        message=message,
+                        text=text,
+                        expiration_generator=expiration_generator,
+                    ),
                 )
-            )
-        self.notify()
+                self._message_queue_order.insert(index, canonical_identifier)
+                self._queued_keys.add((queue_identifier, text))
+                enqueued = True
+        if enqueued:
+            self.notify()
 
     def enqueue_global(self, message: Message):
         """ Helper to enqueue a message in the global queue (e.g. Delivered) """
-        self.enqueue(
-            queue_identifier=QueueIdentifier(
-                recipient=self.receiver, canonical_identifier=CANONICAL_IDENTIFIER_GLOBAL_QUEUE
-            ),
-            message=message,
+        self.enqueue_global_many([message])
+
+    def enqueue_global_many(self, messages: List[Message]):
+        """ Helper to enqueue several messages in the global queue, see `enqueue_global` """
+        queue_identifier = QueueIdentifier(
+            recipient=self.receiver, canonical_identifier=CANONICAL_IDENTIFIER_GLOBAL_QUEUE
         )
+        self.enqueue_many([(queue_identifier, message) for message in messages])
 
     def notify(self):
         """ Notify main loop to check if anything needs to be sent """
+        # The event is level-triggered, if it is already set the main loop has a pending wakeup
+        # which will see everything enqueued so far, so several notifications coalesce into one
+        if self._notify_event.is_set():
+            return
         with self._lock:
             self._notify_event.set()
 
@@ -184,44 +256,53 @@ class _RetryQueue(Runnable):
             # During startup global messages have to be sent first
             self.transport._global_send_queue.join()
 
-        self.log.debug("Retrying message", receiver=to_checksum_address(self.receiver))
+        self.log.debug("Retrying message", receiver=self._receiver_checksum)
         status = self.transport._address_mgr.get_address_reachability(self.receiver)
         if status is not AddressReachability.REACHABLE:
             # if partner is not reachable, return
             self.log.debug(
-                "Partner not reachable. Skipping.",
-                partner=to_checksum_address(self.receiver),
-                status=status,
+                "Partner not reachable. Skipping.", partner=self._receiver_checksum, status=status
             )
             return
-        # sort output by channel_identifier (so global/unordered queue goes first)
-        # inside queue, preserve order in which messages were enqueued
-        ordered_queue = sorted(
-            self._message_queue, key=lambda d: d.queue_identifier.canonical_identifier
-        )
+        # the queue is already sorted by channel, see `enqueue_many`
         message_texts = [
             data.text
-            for data in ordered_queue
+            for data in self._message_queue
             # if expired_gen generator yields False, message was sent recently, so skip it
             if next(data.expiration_generator)
         ]
 
+        queueids_to_queues = self.transport._queueids_to_queues
+        # Message identifiers of the pending send events, computed once per queue so every
+        # message is checked with a set lookup instead of a scan of its queue
+        queueids_to_message_ids = {
+            queue_identifier: {
+                send_event.message_identifier
+                for send_event in queueids_to_queues[queue_identifier]
+            }
+            for queue_identifier in {data.queue_identifier for data in self._message_queue}
+            if queue_identifier in queueids_to_queues
+        }
+
         def message_is_in_queue(data: _RetryQueue._MessageData) -> bool:
-            return any(
+            return (
                 isinstance(data.message, RetrieableMessage)
-                and send_event.message_identifier == data.message.message_identifier
-                for send_event in self.transport._queueids_to_queues[data.queue_identifier]
+                and data.message.message_identifier
+                in queueids_to_message_ids[data.queue_identifier]
             )
 
         # clean after composing, so any queued messages (e.g. Delivered) are sent at least once
-        for msg_data in self._message_queue[:]:
+        # the remaining messages are collected in new lists, which keeps the cleanup linear
+        remaining_queue: List[_RetryQueue._MessageData] = list()
+        remaining_queue_order: List[CanonicalIdentifier] = list()
+        for msg_data, order in zip(self._message_queue, self._message_queue_order):
             remove = False
             if isinstance(msg_data.message, (Delivered, Ping, Pong)):
                 # e.g. Delivered, send only once and then clear
                 # TODO: Is this correct? Will a missed Delivered be 'fixed' by the
                 #       later `Processed` message?
                 remove = True
-            elif msg_data.queue_identifier not in self.transport._queueids_to_queues:
+            elif msg_data.queue_identifier not in queueids_to_queues:
                 remove = True
                 self.log.debug(
                     "Stopping message send retry",
@@ -239,12 +320,16 @@ class _RetryQueue(Runnable):
                 )
 
             if remove:
-                self._message_queue.remove(msg_data)
+                self._queued_keys.discard((msg_data.queue_identifier, msg_data.text))
+            else:
+                remaining_queue.append(msg_data)
+                remaining_queue_order.append(order)
+
+        self._message_queue = remaining_queue
+        self._message_queue_order = remaining_queue_order
 
         if message_texts:
-            self.log.debug(
-                "Send", receiver=to_checksum_address(self.receiver), messages=message_texts
-            )
+            self.log.debug("Send", receiver=self._receiver_checksum, messages=message_texts)
             self.transport._send_raw(self.receiver, "\n".join(message_texts))
 
     def _run(self):
@@ -252,8 +337,8 @@ class _RetryQueue(Runnable):
         assert self.transport._raiden_service is not None, msg
         self.greenlet.name = (
             f"RetryQueue "
-            f"node:{to_checksum_address(self.transport._raiden_service.address)} "
-            f"recipient:{to_checksum_address(self.receiver)}"
+            f"node:{_checksum_address(self.transport._raiden_service.address)} "
+            f"recipient:{self._receiver_checksum}"
         )
         # run while transport parent is running
         while not self.transport._stop_event.ready():
@@ -262,14 +347,21 @@ class _RetryQueue(Runnable):
                 self._notify_event.clear()
                 if self._message_queue:
                     self._check_and_send()
-            # wait up to retry_interval (or to be notified) before checking again
-            self._notify_event.wait(self.transport._config["retry_interval"])
+            status = self.transport._address_mgr.get_address_reachability(self.receiver)
+            if status is AddressReachability.REACHABLE:
+                # wait up to retry_interval (or to be notified) before checking again
+                timeout = self.transport._config["retry_interval"]
+            else:
+                # nothing can be sent to an unreachable partner, so sleep until notified, which
+                # happens when the partner becomes reachable, on enqueue, or on transport stop
+                timeout = None
+            self._notify_event.wait(timeout)
 
     def __str__(self):
         return self.greenlet.name
 
     def __repr__(self):
-        return f"<{self.__class__.__name__} for {to_normalized_address(self.receiver)}>"
+        return f"<{self.__class__.__name__} for {self._receiver_normalized}>"
 
 
 class MatrixTransport(Runnable):
@@ -292,12 +384,22 @@ class MatrixTransport(Runnable):
 
         def _http_retry_delay() -> Iterable[float]:
             # below constants are defined in raiden.app.App.DEFAULT_CONFIG
-            return timeout_exponential_backoff(
-                config["retries_before_backoff"],
-                config["retry_interval"] / 5,
-                config["retry_interval"],
+            return timeout_jitter(
+                timeout_exponential_backoff(
+                    config["retries_before_backoff"],
+                    config["retry_interval"] / 5,
+                    config["retry_interval"],
+                ),
+                RETRY_JITTER,
             )
 
+        # Timeouts between retries of the same message, shared by all _RetryQueues
+        self._retry_schedule = timeout_exponential_backoff_schedule(
+            config["retries_before_backoff"],
+            config["retry_interval"],
+            config["retry_interval"] * 10,
+        )
+
         self._client: GMatrixClient = make_client(
             available_servers,
             http_pool_maxsize=4,
@@ -312,7 +414,19 @@ class MatrixTransport(Runnable):
         self._address_to_retrier: Dict[Address, _RetryQueue] = dict()
 
         self._global_rooms: Dict[str, Optional[Room]] = dict()
+        self._global_room_suffixes = frozenset(config["global_rooms"])
+        # Matches any room alias which contains one of the global room suffixes, scanning each
+        # alias once. `None` if there are no global rooms, an empty pattern would match anything
+        self._global_room_alias_re: Optional[Pattern[str]] = (
+            re.compile("|".join(re.escape(suffix) for suffix in config["global_rooms"]))
+            if config["global_rooms"]
+            else None
+        )
+        # Maps the suffixes from config['global_rooms'] to the full room aliases, requires the
+        # chain id and is therefore populated on start
+        self._global_room_aliases: Dict[str, str] = dict()
         self._global_send_queue: JoinableQueue[Tuple[str, Message]] = JoinableQueue()
+        self._message_type_to_handler: Dict[type, Optional[Callable[[Any], None]]] = dict()
 
         self._started = False
         self._starting = False
@@ -344,7 +458,7 @@ class MatrixTransport(Runnable):
 
     def __repr__(self):
         if self._raiden_service is not None:
-            node = f" node:{to_checksum_address(self._raiden_service.address)}"
+            node = f" node:{_checksum_address(self._raiden_service.address)}"
         else:
             node = ""
 
@@ -380,7 +494,7 @@ class MatrixTransport(Runnable):
         )
         self.log = log.bind(
             current_user=self._user_id,
-            node=to_checksum_address(self._raiden_service.address),
+            node=_checksum_address(self._raiden_service.address),
             transport_uuid=str(self._uuid),
         )
 
@@ -392,6 +506,7 @@ class MatrixTransport(Runnable):
 
         for suffix in self._config["global_rooms"]:
             room_name = make_room_alias(self.chain_id, suffix)  # e.g. raiden_ropsten_discovery
+            self._global_room_aliases[suffix] = room_name
             room = join_global_room(
                 self._client, room_name, self._config.get("available_servers") or ()
             )
@@ -439,7 +554,7 @@ class MatrixTransport(Runnable):
         # dispatch auth data on first scheduling after start
         state_change = ActionUpdateTransportAuthData(f"{self._user_id}/{self._client.api.token}")
         self.greenlet.name = (
-            f"MatrixTransport._run node:{to_checksum_address(self._raiden_service.address)}"
+            f"MatrixTransport._run node:{_checksum_address(self._raiden_service.address)}"
         )
         self._raiden_service.handle_and_track_state_changes([state_change])
         try:
@@ -500,7 +615,7 @@ class MatrixTransport(Runnable):
         This may be called before transport is started, to ensure events generated during
         start are handled properly.
         """
-        self.log.debug("Whitelist", address=to_checksum_address(address))
+        self.log.debug("Whitelist", address=_checksum_address(address))
         self._address_mgr.add_address(address)
 
     def start_health_check(self, node_address):
@@ -508,25 +623,48 @@ class MatrixTransport(Runnable):
 
         It also whitelists the address to answer invites and listen for messages
         """
-        self.whitelist(node_address)
-        with self._health_lock:
-            node_address_hex = to_normalized_address(node_address)
-            self.log.debug("Healthcheck", peer_address=to_checksum_address(node_address))
+        self.start_health_checks([node_address])
 
-            candidates = [
+    def start_health_checks(self, node_addresses: List[Address]) -> None:
+        """Start healthcheck (status monitoring) for several peers, see `start_health_check`
+
+        The user directory searches and the signature validations, which may have to fetch the
+        users' display names, are done concurrently instead of one request at a time.
+        """
+        for node_address in node_addresses:
+            self.whitelist(node_address)
+            self.log.debug("Healthcheck", peer_address=_checksum_address(node_address))
+
+        pool = gevent.pool.Pool(HEALTH_CHECK_POOL_SIZE)
+
+        def search_users(node_address: Address) -> List[User]:
+            node_address_hex = to_normalized_address(node_address)
+            return [
                 self._get_user(user)
                 for user in self._client.search_user_directory(node_address_hex)
             ]
-            user_ids = {
-                user.user_id
-                for user in candidates
-                if validate_userid_signature(user) == node_address
-            }
-            self._address_mgr.add_userids_for_address(node_address, user_ids)
 
-            # Ensure network state is updated in case we already know about the user presences
-            # representing the target node
-            self._address_mgr.refresh_address_presence(node_address)
+        candidates = [
+            (node_address, user)
+            for node_address, users in zip(node_addresses, pool.map(search_users, node_addresses))
+            for user in users
+        ]
+        signers = pool.map(validate_userid_signature, [user for _, user in candidates])
+
+        address_to_user_ids: Dict[Address, Set[str]] = {
+            node_address: set() for node_address in node_addresses
+        }
+        for (node_address, user), signer in zip(candidates, signers):
+            if signer == node_address:
+                address_to_user_ids[node_address].add(user.user_id)
+
+        with self._health_lock:
+            for node_address, user_ids in address_to_user_ids.items():
+                self._address_mgr.add_userids_for_address(node_address, user_ids)
+
+                # Ensure network state is updated in case we already know about the user
+                # presences representing the target node
+                self._address_mgr.refresh_address_presence(node_address)
 
     def send_async(self, queue_identifier: QueueIdentifier, message: Message):
         """Queue the message for sending to recipient in the queue_identifier
@@ -535,6 +673,24 @@ class MatrixTransport(Runnable):
         The actual sending is started only when the transport is started
         """
         # even if transport is not started, can run to enqueue messages to send when it starts
+        self._validate_send_async(queue_identifier, message)
+        self._send_with_retry(queue_identifier, message)
+
+    def send_async_many(self, messages: List[Tuple[QueueIdentifier, Message]]) -> None:
+        """Queue several messages for sending, see `send_async`
+
+        The messages are grouped by recipient, so each retrier is locked and notified only once
+        instead of once per message, e.g. when the message queues are restored on startup.
+        """
+        grouped_messages: Dict[Address, List[Tuple[QueueIdentifier, Message]]] = defaultdict(list)
+        for queue_identifier, message in messages:
+            self._validate_send_async(queue_identifier, message)
+            grouped_messages[queue_identifier.recipient].append((queue_identifier, message))
+
+        for receiver_address, messages_for_receiver in grouped_messages.items():
+            self._get_retrier(receiver_address).enqueue_many(messages_for_receiver)
+
+    def _validate_send_async(self, queue_identifier: QueueIdentifier, message: Message) -> None:
         receiver_address = queue_identifier.recipient
 
         if not is_binary_address(receiver_address):
@@ -546,13 +702,11 @@ class MatrixTransport(Runnable):
 
         self.log.debug(
             "Send async",
-            receiver_address=to_checksum_address(receiver_address),
+            receiver_address=_checksum_address(receiver_address),
             message=message,
             queue_identifier=queue_identifier,
         )
 
-        self._send_with_retry(queue_identifier, message)
-
     def send_global(self, room: str, message: Message) -> None:
         """Sends a message to one of the global rooms
 
@@ -569,12 +723,16 @@ class MatrixTransport(Runnable):
 
     def _global_send_worker(self):
         def _send_global(room_name, serialized_message):
-            if not any(suffix in room_name for suffix in self._config["global_rooms"]):
+            if room_name not in self._global_room_suffixes:
                 raise RuntimeError(
                     f'Send global called on non-global room "{room_name}". '
                     f'Known global rooms: {self._config["global_rooms"]}.'
                 )
-            room_name = make_room_alias(self.chain_id, room_name)
+            room_alias = self._global_room_aliases.get(room_name)
+            if room_alias is None:
+                room_alias = make_room_alias(self.chain_id, room_name)
+                self._global_room_aliases[room_name] = room_alias
+            room_name = room_alias
             if room_name not in self._global_rooms:
                 room = join_global_room(
                     self._client, room_name, self._config.get("available_servers") or ()
@@ -595,13 +753,19 @@ class MatrixTransport(Runnable):
         while not self._stop_event.ready():
             self._global_send_event.clear()
             messages: Dict[str, List[Message]] = defaultdict(list)
-            while self._global_send_queue.qsize() > 0:
-                room_name, message = self._global_send_queue.get()
+            # Drain what is queued right now without blocking, in chunks, so a large backlog
+            # (e.g. on startup) is interleaved with the sending and with other greenlets
+            for _ in range(GLOBAL_SEND_CHUNK_SIZE):
+                try:
+                    room_name, message = self._global_send_queue.get_nowait()
+                except Empty:
+                    break
                 messages[room_name].append(message)
             for room_name, messages_for_room in messages.items():
-                message_text = "\n".join(
-                    MessageSerializer.serialize(message) for message in messages_for_room
-                )
+                # The same broadcast may have been queued several times, e.g. during a restart,
+                # it is only sent once. Deduplicating by the serialized text is exact, and also
+                # works for messages which are not hashable
+                message_text = MessageSerializer.serialize_many(messages_for_room, unique=True)
                 _send_global(room_name, message_text)
                 for _ in messages_for_room:
                     # Every message needs to be marked as done.
@@ -609,6 +773,12 @@ class MatrixTransport(Runnable):
                     # https://github.com/gevent/gevent/issues/1436
                     self._global_send_queue.task_done()
 
+            if not self._global_send_queue.empty():
+                # More messages are pending, send the next chunk after giving other greenlets
+                # a chance to run
+                gevent.sleep(0)
+                continue
+
             # Stop prioritizing global messages after initial queue has been emptied
             self._prioritize_global_messages = False
             self._global_send_event.wait(self._config["retry_interval"])
@@ -639,12 +809,7 @@ class MatrixTransport(Runnable):
             room_aliases = set(room.aliases)
             if room.canonical_alias:
                 room_aliases.add(room.canonical_alias)
-            room_alias_is_global = any(
-                global_alias in room_alias
-                for global_alias in self._config["global_rooms"]
-                for room_alias in room_aliases
-            )
-            if room_alias_is_global:
+            if self._is_any_alias_global(room_aliases):
                 continue
             # we add listener for all valid rooms, _handle_message should ignore them
             # if msg sender isn't whitelisted yet
@@ -724,15 +889,19 @@ class MatrixTransport(Runnable):
         # _leave_unused_rooms will clear it in the future, if and when needed
         room: Optional[Room] = None
         last_ex: Optional[Exception] = None
-        retry_interval = 0.1
-        for _ in range(JOIN_RETRIES):
+        # many peers may invite at once (e.g. after a server restart), the jitter keeps their
+        # retries from hitting the server at the same time
+        retry_intervals = timeout_jitter(
+            timeout_exponential_backoff(1, INVITE_JOIN_RETRY_INTERVAL, INVITE_JOIN_RETRY_MAXIMUM),
+            RETRY_JITTER,
+        )
+        for retry_interval in islice(retry_intervals, JOIN_RETRIES):
             try:
                 room = self._client.join_room(room_id)
             except MatrixRequestError as e:
                 last_ex = e
                 if self._stop_event.wait(retry_interval):
                     break
-                retry_interval = retry_interval * 2
             else:
                 break
         else:
@@ -753,14 +922,16 @@ class MatrixTransport(Runnable):
             "Joined from invite",
             room_id=room_id,
             aliases=room.aliases,
-            inviting_address=to_checksum_address(peer_address),
+            inviting_address=_checksum_address(peer_address),
         )
 
     def _handle_message(self, room, event) -> bool:
         """ Handle text messages sent to listening rooms """
+        # The listener is registered for "m.room.message" only, so the type check is cheap and
+        # almost always passes. Redacted messages have no msgtype in their content
         if (
             event["type"] != "m.room.message"
-            or event["content"]["msgtype"] != "m.text"
+            or event["content"].get("msgtype") != "m.text"
             or self._stop_event.ready()
         ):
             # Ignore non-messages and non-text messages
@@ -788,7 +959,7 @@ class MatrixTransport(Runnable):
             self.log.debug(
                 "Message from non-whitelisted peer - ignoring",
                 sender=user,
-                sender_address=to_checksum_address(peer_address),
+                sender_address=_checksum_address(peer_address),
                 room=room,
             )
             return False
@@ -796,17 +967,18 @@ class MatrixTransport(Runnable):
         # rooms we created and invited user, or were invited specifically by them
         room_ids = self._get_room_ids_for_address(peer_address)
 
+        is_public_room_but_private_required = self._private_rooms and not room.invite_only
         # TODO: Remove clause after `and` and check if things still don't hang
-        if room.room_id not in room_ids and (self._private_rooms and not room.invite_only):
+        if room.room_id not in room_ids and is_public_room_but_private_required:
             # this should not happen, but is not fatal, as we may not know user yet
-            if self._private_rooms and not room.invite_only:
+            if is_public_room_but_private_required:
                 reason = "required private room, but received message in a public"
             else:
                 reason = "unknown room for user"
             self.log.debug(
                 "Ignoring invalid message",
                 peer_user=user.user_id,
-                peer_address=to_checksum_address(peer_address),
+                peer_address=_checksum_address(peer_address),
                 room=room,
                 expected_room_ids=room_ids,
                 reason=reason,
@@ -822,23 +994,13 @@ class MatrixTransport(Runnable):
             self.log.debug(
                 "Received message triggered new comms room for peer",
                 peer_user=user.user_id,
-                peer_address=to_checksum_address(peer_address),
+                peer_address=_checksum_address(peer_address),
                 known_user_rooms=room_ids,
                 room=room,
             )
             self._set_room_id_for_address(peer_address, room.room_id)
 
-        is_peer_reachable = self._address_mgr.get_address_reachability(peer_address) is (
-            AddressReachability.REACHABLE
-        )
-        if not is_peer_reachable:
-            self.log.debug(
-                "Forcing presence update",
-                peer_address=to_checksum_address(peer_address),
-                user_id=sender_id,
-            )
-            self._address_mgr.force_user_presence(user, UserPresence.ONLINE)
-            self._address_mgr.refresh_address_presence(peer_address)
+        self._maybe_force_presence(peer_address, user)
 
         messages = validate_and_parse_message(event["content"]["body"], peer_address)
 
@@ -848,29 +1010,68 @@ class MatrixTransport(Runnable):
         self.log.debug(
             "Incoming messages",
             messages=messages,
-            sender=to_checksum_address(peer_address),
+            sender=_checksum_address(peer_address),
             sender_user=user,
             room=room,
         )
 
-        for message in messages:
-            if not isinstance(message, (SignedRetrieableMessage, SignedMessage)):
-                self.log.warning("Received invalid message", message=message)
-            if isinstance(message, Delivered):
-                self._receive_delivered(message)
-            elif isinstance(message, Processed):
-                self._receive_message(message)
-            else:
-                assert isinstance(message, SignedRetrieableMessage)
-                self._receive_message(message)
+        message_type_to_handler = self._message_type_to_handler
+
+        def get_handler(message: Message) -> Optional[Callable[[List[Any]], None]]:
+            message_type = type(message)
+            if message_type not in message_type_to_handler:
+                message_type_to_handler[message_type] = self._get_message_handler(message_type)
+            return message_type_to_handler[message_type]
+
+        # consecutive messages with the same handler are handled together, e.g. the Delivered
+        # for all of them are enqueued at once, the order of the messages is preserved
+        for handler, messages_group in groupby(messages, key=get_handler):
+            if handler is None:
+                for message in messages_group:
+                    self.log.warning("Received invalid message", message=message)
+                continue
+            handler(list(messages_group))
 
         return True
 
+    def _maybe_force_presence(self, peer_address: Address, user: User) -> None:
+        """ Mark `user` online if its peer isn't reachable, we just received an event from it
+
+        Once the peer is reachable this is a single lookup, so a burst of events from the same
+        peer refreshes its presence only once.
+        """
+        status = self._address_mgr.get_address_reachability(peer_address)
+        if status is AddressReachability.REACHABLE:
+            return
+        self.log.debug(
+            "Forcing presence update",
+            peer_address=_checksum_address(peer_address),
+            user_id=user.user_id,
+        )
+        self._address_mgr.force_user_presence(user, UserPresence.ONLINE)
+        self._address_mgr.refresh_address_presence(peer_address)
+
+    def _get_message_handler(self, message_type: type) -> Optional[Callable[[List[Any]], None]]:
+        """ Return the method which handles a list of received messages of `message_type`
+
+        Returns `None` for messages which must not be received from a peer. The result only
+        depends on the type, `_handle_message` caches it in `_message_type_to_handler`.
+        """
+        if issubclass(message_type, Delivered):
+            return self._receive_delivered_messages
+        if issubclass(message_type, (Processed, SignedRetrieableMessage)):
+            return self._receive_messages
+        return None
+
+    def _receive_delivered_messages(self, messages: List[Delivered]):
+        for delivered in messages:
+            self._receive_delivered(delivered)
+
     def _receive_delivered(self, delivered: Delivered):
         assert delivered.sender is not None, MYPY_ANNOTATION
         self.log.debug(
             "Delivered message received",
-            sender=to_checksum_address(delivered.sender),
+            sender=_checksum_address(delivered.sender),
             message=delivered,
         )
 
@@ -878,41 +1079,57 @@ class MatrixTransport(Runnable):
         self._raiden_service.on_message(delivered)
 
     def _receive_message(self, message: Union[SignedRetrieableMessage, Processed]):
+        self._receive_messages([message])
+
+    def _receive_messages(self, messages: List[Union[SignedRetrieableMessage, Processed]]):
+        """ Acknowledge and handle received messages
+
+        The Delivered for all messages of a sender are enqueued at once, so the sender's retrier is
+        locked and notified only once.
+        """
         assert self._raiden_service is not None
-        assert message.sender is not None, MYPY_ANNOTATION
-        self.log.debug(
-            "Message received",
-            node=to_checksum_address(self._raiden_service.address),
-            message=message,
-            sender=to_checksum_address(message.sender),
-        )
+        sender_to_delivered: Dict[Address, List[Message]] = defaultdict(list)
+        for message in messages:
+            assert message.sender is not None, MYPY_ANNOTATION
+            self.log.debug(
+                "Message received",
+                node=_checksum_address(self._raiden_service.address),
+                message=message,
+                sender=_checksum_address(message.sender),
+            )
 
-        # TODO: Maybe replace with Matrix read receipts.
-        #       Unfortunately those work on an 'up to' basis, not on individual messages
-        #       which means that message order is important which isn't guaranteed between
-        #       federated servers.
-        #       See: https://matrix.org/docs/spec/client_server/r0.3.0.html#id57
-        delivered_message = Delivered(
-            delivered_message_identifier=message.message_identifier, signature=EMPTY_SIGNATURE
-        )
-        self._raiden_service.sign(delivered_message)
+            # TODO: Maybe replace with Matrix read receipts.
+            #       Unfortunately those work on an 'up to' basis, not on individual messages
+            #       which means that message order is important which isn't guaranteed between
+            #       federated servers.
+            #       See: https://matrix.org/docs/spec/client_server/r0.3.0.html#id57
+            delivered_message = Delivered(
+                delivered_message_identifier=message.message_identifier, signature=EMPTY_SIGNATURE
+            )
+            self._raiden_service.sign(delivered_message)
 
-        if message.sender:  # Ignore unsigned messages
-            retrier = self._get_retrier(message.sender)
-            retrier.enqueue_global(delivered_message)
-            self._raiden_service.on_message(message)
+            if message.sender:  # Ignore unsigned messages
+                sender_to_delivered[message.sender].append(delivered_message)
+
+        for sender, delivered_messages in sender_to_delivered.items():
+            self._get_retrier(sender).enqueue_global_many(delivered_messages)
+
+        for message in messages:
+            if message.sender:
+                self._raiden_service.on_message(message)
 
     def _receive_to_device(self, to_device: ToDevice):
         assert to_device.sender is not None, MYPY_ANNOTATION
         self.log.debug(
             "ToDevice message received",
-            sender=to_checksum_address(to_device.sender),
+            sender=_checksum_address(to_device.sender),
             message=to_device,
         )
 
     def _get_retrier(self, receiver: Address) -> _RetryQueue:
         """ Construct and return a _RetryQueue for receiver """
-        if receiver not in self._address_to_retrier:
+        retrier = self._address_to_retrier.get(receiver)
+        if retrier is None:
             retrier = _RetryQueue(transport=self, receiver=receiver)
             self._address_to_retrier[receiver] = retrier
             # Always start the _RetryQueue, otherwise `stop` will block forever
@@ -922,7 +1139,7 @@ class MatrixTransport(Runnable):
             retrier.start()
             # ``Runnable.start()`` may re-create the internal greenlet
             retrier.greenlet.link_exception(self.on_error)
-        return self._address_to_retrier[receiver]
+        return retrier
 
     def _send_with_retry(self, queue_identifier: QueueIdentifier, message: Message):
         retrier = self._get_retrier(queue_identifier.recipient)
@@ -932,11 +1149,11 @@ class MatrixTransport(Runnable):
         with self._getroom_lock:
             room = self._get_room_for_address(receiver_address)
         if not room:
-            self.log.error("No room for receiver", receiver=to_checksum_address(receiver_address))
+            self.log.error("No room for receiver", receiver=_checksum_address(receiver_address))
             return
         self.log.debug(
             "Send raw",
-            receiver=to_checksum_address(receiver_address),
+            receiver=_checksum_address(receiver_address),
             room=room,
             data=data.replace("\n", "\\n"),
         )
@@ -955,8 +1172,7 @@ class MatrixTransport(Runnable):
             # This loop is used to ignore any global rooms that may have 'polluted' the
             # user's room cache due to bug #3765
             # Can be removed after the next upgrade that switches to a new TokenNetworkRegistry
-            while room_ids:
-                room_id = room_ids.pop(0)
+            for room_id in room_ids:
                 room = self._client.rooms[room_id]
                 if not self._is_room_global(room):
                     self.log.debug("Existing room", room=room, members=room.get_joined_members())
@@ -964,20 +1180,28 @@ class MatrixTransport(Runnable):
                 self.log.warning("Ignoring global room for peer", room=room, peer=address_hex)
 
         assert self._raiden_service is not None
-        address_pair = sorted(
-            [to_normalized_address(address) for address in [address, self._raiden_service.address]]
-        )
-        room_name = make_room_alias(self.chain_id, *address_pair)
+        # the peer's address was already normalized above
+        our_address_hex = to_normalized_address(self._raiden_service.address)
+        room_name = make_room_alias(self.chain_id, *sorted((address_hex, our_address_hex)))
 
         # no room with expected name => create one and invite peer
-        peer_candidates = [
-            self._get_user(user) for user in self._client.search_user_directory(address_hex)
+        # the signatures of the known user ids were validated when they were added to the address
+        # manager, the user directory is only searched if no user is known for the peer yet
+        peers = [
+            self._get_user(user_id)
+            for user_id in self._address_mgr.get_userids_for_address(address)
         ]
+        if not peers:
+            peer_candidates = [
+                self._get_user(user) for user in self._client.search_user_directory(address_hex)
+            ]
 
-        # filter peer_candidates
-        peers = [user for user in peer_candidates if validate_userid_signature(user) == address]
+            # filter peer_candidates
+            peers = [
+                user for user in peer_candidates if validate_userid_signature(user) == address
+            ]
         if not peers and not allow_missing_peers:
-            self.log.error("No valid peer found", peer_address=to_checksum_address(address))
+            self.log.error("No valid peer found", peer_address=_checksum_address(address))
             return None
 
         if self._private_rooms:
@@ -986,30 +1210,49 @@ class MatrixTransport(Runnable):
             room = self._get_public_room(room_name, invitees=peers)
 
         peer_ids = self._address_mgr.get_userids_for_address(address)
-        member_ids = {member.user_id for member in room.get_joined_members(force_resync=True)}
-        room_is_empty = not bool(peer_ids & member_ids)
+        # `room._members` is kept up to date by the membership events received through /sync,
+        # the resync only adds the members we may not have received events for yet
+        room.get_joined_members(force_resync=True)
+        room_is_empty = peer_ids.isdisjoint(room._members)
         if room_is_empty:
             last_ex: Optional[Exception] = None
             retry_interval = ROOM_JOIN_RETRY_INTERVAL
             self.log.debug(
                 "Waiting for peer to join from invite",
                 room=room,
-                peer_address=to_checksum_address(address),
+                peer_address=_checksum_address(address),
             )
-            for _ in range(JOIN_RETRIES):
-                try:
-                    member_ids = {
-                        member.user_id for member in room.get_joined_members(force_resync=True)
-                    }
-                except MatrixRequestError as e:
-                    last_ex = e
-                room_is_empty = not bool(peer_ids & member_ids)
-                if room_is_empty or last_ex:
-                    if self._stop_event.wait(retry_interval):
+            peer_joined = Event()
+
+            def on_member_event(_room: Room, event: Dict[str, Any]) -> None:
+                if (
+                    event["content"].get("membership") == "join"
+                    and event.get("state_key") in peer_ids
+                ):
+                    peer_joined.set()
+
+            # The peer's join arrives as a membership event through /sync, the joined members
+            # are only requested again if it doesn't arrive within `retry_interval`
+            listener_id = room.add_listener(on_member_event, "m.room.member")
+            try:
+                for _ in range(JOIN_RETRIES):
+                    gevent.wait([peer_joined, self._stop_event], timeout=retry_interval, count=1)
+                    if self._stop_event.ready():
+                        break
+                    if peer_joined.is_set():
+                        room_is_empty = False
+                        last_ex = None
+                        break
+                    try:
+                        room.get_joined_members(force_resync=True)
+                    except MatrixRequestError as e:
+                        last_ex = e
+                    room_is_empty = peer_ids.isdisjoint(room._members)
+                    if not (room_is_empty or last_ex):
                         break
                     retry_interval *= ROOM_JOIN_RETRY_INTERVAL_MULTIPLIER
-                else:
-                    break
+            finally:
+                room.remove_listener(listener_id)
 
             if room_is_empty or last_ex:
                 if last_ex:
@@ -1019,7 +1262,7 @@ class MatrixTransport(Runnable):
                     self.log.error(
                         "Peer has not joined from invite yet, should join eventually",
                         room=room,
-                        peer_address=to_checksum_address(address),
+                        peer_address=_checksum_address(address),
                     )
 
         self._address_mgr.add_userids_for_address(address, {user.user_id for user in peers})
@@ -1028,15 +1271,15 @@ class MatrixTransport(Runnable):
         if not room.listeners:
             room.add_listener(self._handle_message, "m.room.message")
 
-        self.log.debug("Channel room", peer_address=to_checksum_address(address), room=room)
+        self.log.debug("Channel room", peer_address=_checksum_address(address), room=room)
         return room
 
     def _is_room_global(self, room):
-        return any(
-            suffix in room_alias
-            for suffix in self._config["global_rooms"]
-            for room_alias in room.aliases
-        )
+        return self._is_any_alias_global(room.aliases)
+
+    def _is_any_alias_global(self, room_aliases: Iterable[str]) -> bool:
+        pattern = self._global_room_alias_re
+        return pattern is not None and any(pattern.search(alias) for alias in room_aliases)
 
     def _get_private_room(self, invitees: List[User]):
         """ Create an anonymous, private room and invite peers """
@@ -1071,8 +1314,10 @@ class MatrixTransport(Runnable):
                     )
             else:
                 # Invite users to existing room
-                member_ids = {user.user_id for user in room.get_joined_members(force_resync=True)}
-                users_to_invite = set(invitees_uids) - member_ids
+                room.get_joined_members(force_resync=True)
+                users_to_invite = {
+                    user_id for user_id in invitees_uids if user_id not in room._members
+                }
                 self.log.debug("Inviting users", room=room, invitee_ids=users_to_invite)
                 for invitee_id in users_to_invite:
                     room.invite_user(invitee_id)
@@ -1113,7 +1358,7 @@ class MatrixTransport(Runnable):
         assert self._raiden_service is not None  # make mypy happy
         greenlet = self._schedule_new_greenlet(self._maybe_invite_user, user)
         greenlet.name = (
-            f"invite node:{to_checksum_address(self._raiden_service.address)} user:{user}"
+            f"invite node:{_checksum_address(self._raiden_service.address)} user:{user}"
         )
 
     def _address_reachability_changed(self, address: Address, reachability: AddressReachability):
@@ -1148,14 +1393,14 @@ class MatrixTransport(Runnable):
             room.get_joined_members(force_resync=True)
         if user.user_id not in room._members:
             self.log.debug(
-                "Inviting", peer_address=to_checksum_address(peer_address), user=user, room=room
+                "Inviting", peer_address=_checksum_address(peer_address), user=user, room=room
             )
             try:
                 room.invite_user(user.user_id)
             except (json.JSONDecodeError, MatrixRequestError):
                 self.log.warning(
                     "Exception inviting user, maybe their server is not healthy",
-                    peer_address=to_checksum_address(peer_address),
+                    peer_address=_checksum_address(peer_address),
                     user=user,
                     room=room,
                     exc_info=True,
@@ -1191,16 +1436,17 @@ class MatrixTransport(Runnable):
         If room_id is falsy, clean list of rooms. Else, push room_id to front of the list """
 
         assert not room_id or room_id in self._client.rooms, "Invalid room_id"
-        address_hex: AddressHex = to_checksum_address(address)
+        address_hex: AddressHex = _checksum_address(address)
         # filter_private=False to preserve public rooms on the list, even if we require privacy
         room_ids = self._get_room_ids_for_address(address, filter_private=False)
 
         with self._account_data_lock:
-            # no need to deepcopy, we don't modify lists in-place
+            # no need to copy, the mapping is only accessed with the lock held and a sync replaces
+            # it instead of mutating it. We don't modify the lists in-place either
             # cast generic Dict[str, Any] to types we expect, to satisfy mypy, runtime no-op
             _address_to_room_ids = cast(
                 Dict[AddressHex, List[_RoomID]],
-                self._client.account_data.get("network.raiden.rooms", {}).copy(),
+                self._client.account_data.get("network.raiden.rooms", {}),
             )
 
             changed = False
@@ -1209,7 +1455,8 @@ class MatrixTransport(Runnable):
                 _address_to_room_ids.pop(address_hex, None)
             else:
                 # push to front
-                room_ids = [room_id] + [r for r in room_ids if r != room_id]
+                # dict keeps the insertion order, this also drops duplicated room ids
+                room_ids = list(dict.fromkeys([room_id, *room_ids]))
                 if room_ids != _address_to_room_ids.get(address_hex):
                     _address_to_room_ids[address_hex] = room_ids
                     changed = True
@@ -1227,7 +1474,7 @@ class MatrixTransport(Runnable):
         If filter_private=True, also filter out public rooms.
         If filter_private=None, filter according to self._private_rooms
         """
-        address_hex: AddressHex = to_checksum_address(address)
+        address_hex: AddressHex = _checksum_address(address)
         with self._account_data_lock:
             room_ids = self._client.account_data.get("network.raiden.rooms", {}).get(address_hex)
             self.log.debug("Room ids for address", for_address=address_hex, room_ids=room_ids)
@@ -1236,17 +1483,18 @@ class MatrixTransport(Runnable):
             if not isinstance(room_ids, list):  # old version, single room
                 room_ids = [room_ids]
 
+            rooms = self._client.rooms
             if filter_private is None:
                 filter_private = self._private_rooms
             if not filter_private:
                 # existing rooms
-                room_ids = [room_id for room_id in room_ids if room_id in self._client.rooms]
+                room_ids = [room_id for room_id in room_ids if room_id in rooms]
             else:
                 # existing and private rooms
                 room_ids = [
                     room_id
                     for room_id in room_ids
-                    if room_id in self._client.rooms and self._client.rooms[room_id].invite_only
+                    if room_id in rooms and rooms[room_id].invite_only
                 ]
 
             return room_ids
@@ -1271,7 +1519,9 @@ class MatrixTransport(Runnable):
         """ Sends send-to-device events to a all known devices of a peer without retries. """
         user_ids = self._address_mgr.get_userids_for_address(address)
 
-        data = {user_id: {"*": MessageSerializer.serialize(message)} for user_id in user_ids}
+        # the payload is the same for every user, serialize it only once
+        message_text = MessageSerializer.serialize(message)
+        data = {user_id: {"*": message_text} for user_id in user_ids}
 
         return self._client.api.send_to_device("m.to_device_message", data)
 
@@ -1306,22 +1556,11 @@ class MatrixTransport(Runnable):
             self.log.debug(
                 "ToDevice Message from non-whitelisted peer - ignoring",
                 sender=user,
-                sender_address=to_checksum_address(peer_address),
+                sender_address=_checksum_address(peer_address),
             )
             return False
 
-        is_peer_reachable = self._address_mgr.get_address_reachability(peer_address) is (
-            AddressReachability.REACHABLE
-        )
-
-        if not is_peer_reachable:
-            self.log.debug(
-                "Forcing presence update",
-                peer_address=to_checksum_address(peer_address),
-                user_id=sender_id,
-            )
-            self._address_mgr.force_user_presence(user, UserPresence.ONLINE)
-            self._address_mgr.refresh_address_presence(peer_address)
+        self._maybe_force_presence(peer_address, user)
 
         messages = validate_and_parse_message(event["content"], peer_address)
 
@@ -1331,7 +1570,7 @@ class MatrixTransport(Runnable):
         self.log.debug(
             "Incoming ToDevice Messages",
             messages=messages,
-            sender=to_checksum_address(peer_address),
+            sender=_checksum_address(peer_address),
             sender_user=user,
         )
 
@@ -1342,7 +1581,7 @@ class MatrixTransport(Runnable):
                 log.warning(
                     "Received Message is not of type ToDevice, invalid",
                     message=message,
-                    peer_address=to_checksum_address(peer_address),
+                    peer_address=_checksum_address(peer_address),
                 )
                 continue
 
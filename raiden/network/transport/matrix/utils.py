@@ -5,11 +5,24 @@ from collections import defaultdict
 from enum import Enum
 from operator import attrgetter, itemgetter
 from random import Random
-from typing import Any, Callable, Dict, Iterable, KeysView, List, Optional, Sequence, Set, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    KeysView,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
 from urllib.parse import urlparse
 from uuid import UUID
 
 import gevent
+import gevent.pool
 import structlog
 from cachetools import LRUCache, cached
 from eth_utils import (
@@ -40,6 +53,20 @@ USERID_RE = re.compile(r"^@(0x[0-9a-f]{40})(?:\.[0-9a-f]{8})?(?::.+)?$")
 DISPLAY_NAME_HEX_RE = re.compile(r"^0x[0-9a-fA-F]{130}$")
 ROOM_NAME_SEPARATOR = "_"
 ROOM_NAME_PREFIX = "raiden"
+# Number of (user_id, displayname) pairs whose recovered address is kept, every message from a
+# peer validates its user, so this should be large enough to hold all users of the known peers
+USERID_SIGNATURE_CACHE_SIZE = 4096
+# HTTP error codes of a room alias that can't be resolved or joined on a server, the next
+# server is tried instead
+ROOM_NOT_AVAILABLE_ERROR_CODES = frozenset({403, 404, 500})
+# HTTP error codes of a room creation which failed because the alias is already taken
+ROOM_ALIAS_TAKEN_ERROR_CODES = frozenset({400, 409})
+# HTTP error codes of a room alias on our own server which isn't joinable (yet), unlike other
+# servers a server error here is not ignored
+ROOM_ALIAS_NOT_JOINABLE_ERROR_CODES = frozenset({403, 404})
+# Matrix error codes of a failed registration which the next username suffix can solve, `None`
+# is a server which doesn't report an error code
+USERNAME_TAKEN_ERROR_CODES = frozenset({None, "M_USER_IN_USE"})
 
 
 class UserPresence(Enum):
@@ -337,21 +364,49 @@ def join_global_room(client: GMatrixClient, name: str, servers: Sequence[str] =
     """
     our_server_name = urlparse(client.api.base_url).netloc
     assert our_server_name, "Invalid client's homeserver url"
-    servers = [our_server_name] + [  # client's own server first
-        urlparse(s).netloc
-        for s in servers
-        if urlparse(s).netloc not in {None, "", our_server_name}
+    # client's own server first, each url is parsed once
+    server_names = (urlparse(server).netloc for server in servers)
+    servers = [our_server_name] + [
+        server_name
+        for server_name in server_names
+        if server_name and server_name != our_server_name
     ]
 
     our_server_global_room_alias_full = f"#{name}:{servers[0]}"
 
+    def resolve_alias(server: str) -> Optional[str]:
+        global_room_alias_full = f"#{name}:{server}"
+        try:
+            return client.api.get_room_id(global_room_alias_full)
+        except MatrixRequestError as ex:
+            if ex.code not in ROOM_NOT_AVAILABLE_ERROR_CODES:
+                raise
+            log.debug(
+                "Could not resolve global room alias",
+                room_alias_full=global_room_alias_full,
+                _exception=ex,
+            )
+            return None
+
+    def servers_to_join() -> Iterator[str]:
+        yield servers[0]
+        # Our server doesn't have the room, look it up on all other servers at once instead of
+        # trying them one after the other, so unreachable servers don't add up their timeouts.
+        # Only resolving an alias has no side effects, the rooms are still joined one at a time
+        # in the order of preference, otherwise several global rooms could end up joined
+        other_servers = servers[1:]
+        room_ids = gevent.pool.Group().map(resolve_alias, other_servers)
+        for server, room_id in zip(other_servers, room_ids):
+            if room_id:
+                yield server
+
     # try joining a global room on any of the available servers, starting with ours
-    for server in servers:
+    for server in servers_to_join():
         global_room_alias_full = f"#{name}:{server}"
         try:
             global_room = client.join_room(global_room_alias_full)
         except MatrixRequestError as ex:
-            if ex.code not in (403, 404, 500):
+            if ex.code not in ROOM_NOT_AVAILABLE_ERROR_CODES:
                 raise
             log.debug(
                 "Could not join global room", room_alias_full=global_room_alias_full, _exception=ex
@@ -367,24 +422,35 @@ def join_global_room(client: GMatrixClient, name: str, servers: Sequence[str] =
         for _ in range(JOIN_RETRIES):
             try:
                 global_room = client.create_room(name, is_public=True)
+                break
             except MatrixRequestError as ex:
-                if ex.code not in (400, 409):
+                if ex.code not in ROOM_ALIAS_TAKEN_ERROR_CODES:
                     raise
-                try:
-                    global_room = client.join_room(our_server_global_room_alias_full)
-                except MatrixRequestError as ex:
-                    if ex.code not in (404, 403):
-                        raise
-                else:
-                    break
-            else:
+
+            # another node created the room after we failed to join it, join theirs
+            try:
+                global_room = client.join_room(our_server_global_room_alias_full)
                 break
+            except MatrixRequestError as ex:
+                if ex.code not in ROOM_ALIAS_NOT_JOINABLE_ERROR_CODES:
+                    raise
         else:
             raise TransportError("Could neither join nor create a global room")
     log.debug("Joined global room", room=global_room)
     return global_room
 
 
+def _get_error_code(ex: MatrixRequestError) -> Optional[str]:
+    """ Return the Matrix `errcode` of a request error, or None if the body has none """
+    try:
+        content = json.loads(ex.content)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(content, dict):
+        return None
+    return content.get("errcode")
+
+
 def login_or_register(
     client: GMatrixClient, signer: Signer, prev_user_id: str = None, prev_access_token: str = None
 ) -> User:
@@ -410,8 +476,10 @@ def login_or_register(
     server_name = urlparse(server_url).netloc
 
     base_username = str(to_normalized_address(signer.address))
-    _match_user = re.match(
-        f"^@{re.escape(base_username)}.*:{re.escape(server_name)}$", prev_user_id or ""
+    _match_user = (
+        prev_user_id is not None
+        and prev_user_id.startswith(f"@{base_username}")
+        and prev_user_id.endswith(f":{server_name}")
     )
     if _match_user:  # same user as before
         assert prev_user_id is not None
@@ -427,9 +495,7 @@ def login_or_register(
                 _exception=ex,
             )
         else:
-            prev_sync_limit = client.set_sync_limit(0)
-            client._sync()  # initial_sync
-            client.set_sync_limit(prev_sync_limit)
+            client.initial_sync()
             log.debug("Success. Valid previous credentials", user_id=prev_user_id)
             return client.get_user(client.user_id)
     elif prev_user_id:
@@ -455,9 +521,7 @@ def login_or_register(
 
         try:
             client.login(username, password, sync=False)
-            prev_sync_limit = client.set_sync_limit(0)
-            client._sync()  # when logging, do initial_sync with limit=0
-            client.set_sync_limit(prev_sync_limit)
+            client.initial_sync()  # when logging, do initial_sync with limit=0
             break
         except MatrixRequestError as ex:
             if ex.code != 403:
@@ -477,6 +541,10 @@ def login_or_register(
             except MatrixRequestError as ex:
                 if ex.code != 400:
                     raise
+                # Any other registration error (e.g. M_INVALID_USERNAME) would fail for all
+                # the suffixes
+                if _get_error_code(ex) not in USERNAME_TAKEN_ERROR_CODES:
+                    raise
                 log.debug("Username taken. Continuing")
                 continue
     else:
@@ -492,7 +560,11 @@ def login_or_register(
     return user
 
 
-@cached(cache=LRUCache(128), key=attrgetter("user_id", "displayname"), lock=Semaphore())
+@cached(
+    cache=LRUCache(USERID_SIGNATURE_CACHE_SIZE),
+    key=attrgetter("user_id", "displayname"),
+    lock=Semaphore(),
+)
 def validate_userid_signature(user: User) -> Optional[Address]:
     """ Validate a userId format and signature on displayName, and return its address"""
     # display_name should be an address in the USERID_RE format
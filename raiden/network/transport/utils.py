@@ -1,4 +1,6 @@
-from raiden.utils.typing import Iterator
+import random
+
+from raiden.utils.typing import Iterable, Iterator, Tuple
 
 
 def timeout_exponential_backoff(retries: int, timeout: int, maximum: int) -> Iterator[int]:
@@ -19,3 +21,31 @@ def timeout_exponential_backoff(retries: int, timeout: int, maximum: int) -> Ite
 
     while True:
         yield maximum
+
+
+def timeout_exponential_backoff_schedule(
+    retries: int, timeout: int, maximum: int
+) -> Tuple[int, ...]:
+    """ The finite prefix of `timeout_exponential_backoff`.
+
+    The last element of the schedule is `maximum`, which the generator returns indefinitely
+    after the schedule is exhausted.
+    """
+    schedule = [timeout] * max(retries, 1)
+
+    while timeout < maximum:
+        timeout = min(timeout * 2, maximum)
+        schedule.append(timeout)
+
+    schedule.append(maximum)
+    return tuple(schedule)
+
+
+def timeout_jitter(timeouts: Iterable[float], jitter: float) -> Iterator[float]:
+    """ Randomly scale every timeout of `timeouts` by a factor in `[1 - jitter, 1 + jitter]`.
+
+    Clients which failed at the same time (e.g. after a server restart) will then spread their
+    retries, instead of retrying in lockstep.
+    """
+    for timeout in timeouts:
+        yield timeout * random.uniform(1 - jitter, 1 + jitter)
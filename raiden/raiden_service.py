@@ -520,9 +520,14 @@ class RaidenService(Runnable):
             prev_auth_data=chain_state.last_transport_authdata,
         )
 
-        for neighbour in views.all_neighbour_nodes(chain_state):
-            if neighbour != ConnectionManager.BOOTSTRAP_ADDR:
-                self.start_health_check_for(neighbour)
+        # Health check all neighbours in one go, so their users are looked up concurrently
+        self.transport.start_health_checks(
+            [
+                neighbour
+                for neighbour in views.all_neighbour_nodes(chain_state)
+                if neighbour != ConnectionManager.BOOTSTRAP_ADDR
+            ]
+        )
 
     def _prepare_and_execute_alarm_first_run(self, last_log_block: BlockNumber) -> None:
         """Prepares the alarm task callback and executes its first run
@@ -885,11 +890,14 @@ class RaidenService(Runnable):
             node=to_checksum_address(self.address),
         )
 
+        messages = list()
         for queue_identifier, event_queue in events_queues.items():
             for event in event_queue:
                 message = message_from_sendevent(event)
                 self.sign(message)
-                self.transport.send_async(queue_identifier, message)
+                messages.append((queue_identifier, message))
+
+        self.transport.send_async_many(messages)
 
     def _initialize_monitoring_services_queue(self, chain_state: ChainState) -> None:
         """Send the monitoring requests for all current balance proofs.
@@ -15,7 +15,7 @@ from marshmallow import ValidationError
 
 from raiden.exceptions import SerializationError
 from raiden.storage.serialization.types import MESSAGE_NAME_TO_QUALIFIED_NAME, SchemaCache
-from raiden.utils.typing import Any, Dict
+from raiden.utils.typing import Any, Dict, Iterable
 
 
 def _import_type(type_name: str) -> type:
@@ -121,6 +121,21 @@ class MessageSerializer(SerializationBase):
 
         return json.dumps(data)
 
+    @staticmethod
+    def serialize_many(
+        messages: Iterable[Any], separator: str = "\n", unique: bool = False
+    ) -> str:
+        """ Serialize `messages` and join them with `separator` in a single pass.
+
+        If `unique` is set, messages with the same serialization are only included once, in the
+        position of their first occurrence.
+        """
+        serialize = MessageSerializer.serialize
+        texts = [serialize(message) for message in messages]
+        if unique:
+            texts = list(dict.fromkeys(texts))
+        return separator.join(texts)
+
     @staticmethod
     def deserialize(data: str) -> Any:
         try:
@@ -113,7 +113,8 @@ class SnapshotRecord(NamedTuple):
 
 
 def assert_sqlite_version() -> bool:  # pragma: no unittest
-    if sqlite3.sqlite_version_info < SQLITE_MIN_REQUIRED_VERSION:
+    major, minor, patch = sqlite3.sqlite_version_info
+    if major * 1_000_000 + minor * 1_000 + patch < SQLITE_MIN_REQUIRED_VERSION:
         return False
     return True
 
@@ -1,4 +1,3 @@
-import re
 from typing import TYPE_CHECKING, Dict
 
 import click
@@ -43,7 +42,7 @@ def _do_check_version(current_version: Tuple[str, ...]) -> bool:
         return False
     # getting the latest release version
     latest_release = parse_version(content["tag_name"])
-    security_message = re.search(SECURITY_EXPRESSION, content["body"])
+    security_message = SECURITY_EXPRESSION.search(content["body"])
     if security_message:
         click.secho(security_message.group(0), fg="red")
         # comparing it to the user's application
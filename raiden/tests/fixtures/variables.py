@@ -12,7 +12,7 @@ from raiden.tests.fixtures.constants import DEFAULT_BALANCE
 from raiden.tests.utils.ci import shortened_artifacts_storage
 from raiden.tests.utils.factories import UNIT_CHAIN_ID
 from raiden.tests.utils.tests import unique_path
-from raiden.utils import sha3
+from raiden.utils import privatekey_to_address, sha3
 from raiden_contracts.constants import TEST_SETTLE_TIMEOUT_MAX, TEST_SETTLE_TIMEOUT_MIN
 
 # we need to use fixture for the default values otherwise
@@ -210,6 +210,12 @@ def private_keys(number_of_nodes, privatekey_seed):
     return result
 
 
+@pytest.fixture
+def participants(private_keys):
+    """ Addresses of the raiden nodes, in the same order as `private_keys`. """
+    return [privatekey_to_address(key) for key in private_keys]
+
+
 @pytest.fixture
 def deploy_key(privatekey_seed):
     return sha3(privatekey_seed.format("deploykey").encode())
@@ -17,7 +17,7 @@ from raiden.tests.utils.smartcontracts import (
     deploy_token,
     deploy_tokens_and_fund_accounts,
 )
-from raiden.utils import privatekey_to_address, typing
+from raiden.utils import typing
 from raiden.utils.typing import Optional
 from raiden_contracts.constants import (
     CONTRACT_CUSTOM_TOKEN,
@@ -41,7 +41,7 @@ def token_contract_name() -> str:
 def deploy_all_tokens_register_and_return_their_addresses(
     token_amount,
     number_of_tokens,
-    private_keys,
+    participants,
     proxy_manager,
     token_network_registry_address,
     register_tokens,
@@ -59,7 +59,6 @@ def deploy_all_tokens_register_and_return_their_addresses(
         register_tokens (bool): controls if tokens will be registered with raiden Registry
     """
 
-    participants = [privatekey_to_address(key) for key in private_keys]
     token_addresses = deploy_tokens_and_fund_accounts(
         token_amount=token_amount,
         number_of_tokens=number_of_tokens,
@@ -70,13 +69,14 @@ def deploy_all_tokens_register_and_return_their_addresses(
     )
 
     if register_tokens:
+        registry = proxy_manager.token_network_registry(token_network_registry_address)
+        block_identifier = proxy_manager.client.blockhash_from_blocknumber("latest")
         for token in token_addresses:
-            registry = proxy_manager.token_network_registry(token_network_registry_address)
             registry.add_token(
                 token_address=token,
                 channel_participant_deposit_limit=RED_EYES_PER_CHANNEL_PARTICIPANT_LIMIT,
                 token_network_deposit_limit=RED_EYES_PER_TOKEN_NETWORK_LIMIT,
-                block_identifier=proxy_manager.client.blockhash_from_blocknumber("latest"),
+                block_identifier=block_identifier,
             )
 
     return token_addresses
@@ -121,7 +121,7 @@ def maybe_deploy_service_registry_and_return_address(
 
 @pytest.fixture(name="user_deposit_address")
 def deploy_user_deposit_and_return_address(
-    proxy_manager, deploy_client, contract_manager, token_proxy, private_keys, environment_type
+    proxy_manager, deploy_client, contract_manager, token_proxy, participants, environment_type
 ) -> typing.Optional[typing.Address]:
     """ Deploy UserDeposit and fund accounts with some balances """
     if environment_type != Environment.DEVELOPMENT:
@@ -137,7 +137,6 @@ def deploy_user_deposit_and_return_address(
 
     user_deposit = proxy_manager.user_deposit(user_deposit_address)
 
-    participants = [privatekey_to_address(key) for key in private_keys]
     for transfer_to in participants:
         user_deposit.deposit(
             beneficiary=transfer_to,
@@ -184,7 +183,7 @@ def secret_registry_proxy(deploy_client, secret_registry_address, contract_manag
     """
     return SecretRegistry(
         jsonrpc_client=deploy_client,
-        secret_registry_address=to_canonical_address(secret_registry_address),
+        secret_registry_address=secret_registry_address,
         contract_manager=contract_manager,
     )
 
@@ -219,8 +218,6 @@ def deploy_token_network_registry_and_return_address(
 def register_token_and_return_the_network_proxy(
     contract_manager, deploy_client, token_proxy, token_network_registry_address
 ):
-    registry_address = to_canonical_address(token_network_registry_address)
-
     blockchain_service = ProxyManager(
         rpc_client=deploy_client,
         contract_manager=contract_manager,
@@ -230,7 +227,9 @@ def register_token_and_return_the_network_proxy(
         ),
     )
 
-    token_network_registry_proxy = blockchain_service.token_network_registry(registry_address)
+    token_network_registry_proxy = blockchain_service.token_network_registry(
+        token_network_registry_address
+    )
     token_network_address = token_network_registry_proxy.add_token(
         token_address=token_proxy.address,
         channel_participant_deposit_limit=RED_EYES_PER_CHANNEL_PARTICIPANT_LIMIT,
@@ -238,14 +237,6 @@ def register_token_and_return_the_network_proxy(
         block_identifier=deploy_client.get_confirmed_blockhash(),
     )
 
-    blockchain_service = ProxyManager(
-        rpc_client=deploy_client,
-        contract_manager=contract_manager,
-        metadata=ProxyManagerMetadata(
-            token_network_registry_deployed_at=GENESIS_BLOCK_NUMBER,
-            filters_start_at=GENESIS_BLOCK_NUMBER,
-        ),
-    )
     return blockchain_service.token_network(token_network_address)
 
 
@@ -1,10 +1,9 @@
-from hashlib import sha256
-from typing import Dict, List
+from functools import lru_cache
+from typing import Callable, Dict, List
 
 import gevent
 import pytest
-from eth_utils import is_list_like, to_checksum_address
-from web3.utils.events import construct_event_topic_set
+from eth_utils import encode_hex, event_abi_to_log_topic, to_checksum_address
 
 from raiden import waiting
 from raiden.api.python import RaidenAPI
@@ -28,10 +27,11 @@ from raiden.transfer.events import ContractSendChannelClose
 from raiden.transfer.mediated_transfer.events import SendLockedTransfer
 from raiden.transfer.mediated_transfer.state_change import ReceiveSecretReveal
 from raiden.transfer.state_change import ContractReceiveSecretReveal
-from raiden.utils import sha3, wait_until
+from raiden.utils import wait_until
 from raiden.utils.typing import (
     Address,
     Balance,
+    BlockNumber,
     BlockSpecification,
     ChannelID,
     TokenNetworkAddress,
@@ -44,33 +44,64 @@ from raiden_contracts.constants import (
 from raiden_contracts.contract_manager import ContractManager
 
 
-def get_netting_channel_closed_events(
+@lru_cache(maxsize=None)
+def _get_event_topic(contract_manager: ContractManager, event_name: str) -> str:
+    """ The hex encoded topic of a TokenNetwork event, the ABI lookup and the hashing of the
+    event signature only happen once per event.
+    """
+    event_abi = contract_manager.get_event_abi(CONTRACT_TOKEN_NETWORK, event_name)
+    return encode_hex(event_abi_to_log_topic(event_abi))
+
+
+def get_netting_channel_events(
     proxy_manager: ProxyManager,
     token_network_address: TokenNetworkAddress,
     netting_channel_identifier: ChannelID,
     contract_manager: ContractManager,
+    events: List[str],
     from_block: BlockSpecification = GENESIS_BLOCK_NUMBER,
     to_block: BlockSpecification = "latest",
-) -> List[Dict]:
-    closed_event_abi = contract_manager.get_event_abi(CONTRACT_TOKEN_NETWORK, ChannelEvent.CLOSED)
-
-    topic_set = construct_event_topic_set(
-        event_abi=closed_event_abi, arguments={"channel_identifier": netting_channel_identifier}
-    )
+) -> Dict[str, List[Dict]]:
+    """ Query the given `events` of a channel with a single `eth_getLogs` call.
+
+    Returns the decoded events grouped by event name.
+    """
+    event_topics = [_get_event_topic(contract_manager, event) for event in events]
+    # The channel identifier is the first indexed argument of all channel events, a uint256
+    channel_topic = encode_hex(netting_channel_identifier.to_bytes(32, "big"))
+    # any of the event topics, for the channel identifier
+    topics = [event_topics, channel_topic]
+
+    result: Dict[str, List[Dict]] = {event: [] for event in events}
+    for decoded_event in get_contract_events(
+        proxy_manager,
+        contract_manager.get_contract_abi(CONTRACT_TOKEN_NETWORK),
+        Address(token_network_address),
+        topics,
+        from_block,
+        to_block,
+    ):
+        result[decoded_event["event"]].append(decoded_event)
+    return result
 
-    if len(topic_set) == 1 and is_list_like(topic_set[0]):
-        topics = topic_set[0]
-    else:
-        topics = topic_set
 
-    return get_contract_events(
+def get_netting_channel_closed_events(
+    proxy_manager: ProxyManager,
+    token_network_address: TokenNetworkAddress,
+    netting_channel_identifier: ChannelID,
+    contract_manager: ContractManager,
+    from_block: BlockSpecification = GENESIS_BLOCK_NUMBER,
+    to_block: BlockSpecification = "latest",
+) -> List[Dict]:
+    return get_netting_channel_events(
         proxy_manager=proxy_manager,
-        abi=contract_manager.get_contract_abi(CONTRACT_TOKEN_NETWORK),
-        contract_address=Address(token_network_address),
-        topics=topics,
+        token_network_address=token_network_address,
+        netting_channel_identifier=netting_channel_identifier,
+        contract_manager=contract_manager,
+        events=[ChannelEvent.CLOSED],
         from_block=from_block,
         to_block=to_block,
-    )
+    )[ChannelEvent.CLOSED]
 
 
 def get_netting_channel_deposit_events(
@@ -81,26 +112,15 @@ def get_netting_channel_deposit_events(
     from_block: BlockSpecification = GENESIS_BLOCK_NUMBER,
     to_block: BlockSpecification = "latest",
 ) -> List[Dict]:
-    deposit_event_abi = contract_manager.get_event_abi(
-        CONTRACT_TOKEN_NETWORK, ChannelEvent.DEPOSIT
-    )
-    topic_set = construct_event_topic_set(
-        event_abi=deposit_event_abi, arguments={"channel_identifier": netting_channel_identifier}
-    )
-
-    if len(topic_set) == 1 and is_list_like(topic_set[0]):
-        topics = topic_set[0]
-    else:
-        topics = topic_set
-
-    return get_contract_events(
-        proxy_manager,
-        contract_manager.get_contract_abi(CONTRACT_TOKEN_NETWORK),
-        Address(token_network_address),
-        topics,
-        from_block,
-        to_block,
-    )
+    return get_netting_channel_events(
+        proxy_manager=proxy_manager,
+        token_network_address=token_network_address,
+        netting_channel_identifier=netting_channel_identifier,
+        contract_manager=contract_manager,
+        events=[ChannelEvent.DEPOSIT],
+        from_block=from_block,
+        to_block=to_block,
+    )[ChannelEvent.DEPOSIT]
 
 
 def get_netting_channel_settled_events(
@@ -111,26 +131,24 @@ def get_netting_channel_settled_events(
     from_block: BlockSpecification = GENESIS_BLOCK_NUMBER,
     to_block: BlockSpecification = "latest",
 ) -> List[Dict]:
-    settled_event_abi = contract_manager.get_event_abi(
-        CONTRACT_TOKEN_NETWORK, ChannelEvent.SETTLED
-    )
-    topic_set = construct_event_topic_set(
-        event_abi=settled_event_abi, arguments={"channel_identifier": netting_channel_identifier}
-    )
+    return get_netting_channel_events(
+        proxy_manager=proxy_manager,
+        token_network_address=token_network_address,
+        netting_channel_identifier=netting_channel_identifier,
+        contract_manager=contract_manager,
+        events=[ChannelEvent.SETTLED],
+        from_block=from_block,
+        to_block=to_block,
+    )[ChannelEvent.SETTLED]
 
-    if len(topic_set) == 1 and is_list_like(topic_set[0]):
-        topics = topic_set[0]
-    else:
-        topics = topic_set
 
-    return get_contract_events(
-        proxy_manager,
-        contract_manager.get_contract_abi(CONTRACT_TOKEN_NETWORK),
-        Address(token_network_address),
-        topics,
-        from_block,
-        to_block,
-    )
+def query_events_concurrently(*queries: Callable[..., List[Dict]], **kwargs) -> List[List[Dict]]:
+    """ Run the event `queries` with the same arguments at once, returning their results in
+    order.
+    """
+    greenlets = [gevent.spawn(query, **kwargs) for query in queries]
+    gevent.joinall(greenlets, raise_error=True)
+    return [greenlet.get() for greenlet in greenlets]
 
 
 def wait_both_channel_open(app0, app1, registry_address, token_address, retry_timeout):
@@ -174,16 +192,17 @@ def test_channel_deposit(raiden_chain, deposit, retry_timeout, token_addresses):
     token_address = token_addresses[0]
 
     registry_address = app0.raiden.default_registry.address
+    chain_state0 = views.state_from_app(app0)
     token_network_address = views.get_token_network_address_by_token_address(
-        views.state_from_app(app0), app0.raiden.default_registry.address, token_address
+        chain_state0, registry_address, token_address
     )
     assert token_network_address
 
     channel0 = views.get_channelstate_by_token_network_and_partner(
-        views.state_from_app(app0), token_network_address, app1.raiden.address
+        chain_state0, token_network_address, app1.raiden.address
     )
     channel1 = views.get_channelstate_by_token_network_and_partner(
-        views.state_from_app(app0), token_network_address, app1.raiden.address
+        chain_state0, token_network_address, app1.raiden.address
     )
     assert channel0 is None
     assert channel1 is None
@@ -236,6 +255,8 @@ def test_query_events(
     app0, app1 = raiden_chain  # pylint: disable=unbalanced-tuple-unpacking
     registry_address = app0.raiden.default_registry.address
     token_address = token_addresses[0]
+    # events are decoded with checksummed addresses
+    app0_address = to_checksum_address(app0.raiden.address)
 
     token_network_address = app0.raiden.default_registry.get_token_network(token_address, "latest")
 
@@ -293,7 +314,7 @@ def test_query_events(
         {
             "event": ChannelEvent.OPENED,
             "args": {
-                "participant1": to_checksum_address(app0.raiden.address),
+                "participant1": app0_address,
                 "participant2": to_checksum_address(app1.raiden.address),
                 "settle_timeout": settle_timeout,
             },
@@ -322,18 +343,29 @@ def test_query_events(
 
     assert_synced_channel_state(token_network_address, app0, Balance(0), [], app1, Balance(0), [])
 
+    # The channel's events are accumulated, every query only asks for the blocks mined since
+    # the previous one
+    netting_channel_events: List[Dict] = []
+    next_block_to_query = GENESIS_BLOCK_NUMBER
+
+    def get_new_netting_channel_events(**kwargs) -> List[Dict]:
+        nonlocal next_block_to_query
+        to_block = app0.raiden.rpc_client.block_number()
+        netting_channel_events.extend(
+            get_all_netting_channel_events(
+                from_block=next_block_to_query, to_block=to_block, **kwargs
+            )
+        )
+        next_block_to_query = BlockNumber(to_block + 1)
+        return netting_channel_events
+
     RaidenAPI(app0.raiden).set_total_channel_deposit(
         registry_address, token_address, app1.raiden.address, deposit
     )
 
-    all_netting_channel_events = get_all_netting_channel_events(
-        proxy_manager=app0.raiden.proxy_manager,
-        token_network_address=token_network_address,
-        netting_channel_identifier=channel_id,
-        contract_manager=app0.raiden.contract_manager,
-    )
-
-    deposit_events = get_netting_channel_deposit_events(
+    all_netting_channel_events, deposit_events = query_events_concurrently(
+        get_new_netting_channel_events,
+        get_netting_channel_deposit_events,
         proxy_manager=app0.raiden.proxy_manager,
         token_network_address=token_network_address,
         netting_channel_identifier=channel_id,
@@ -343,7 +375,7 @@ def test_query_events(
     total_deposit_event = {
         "event": ChannelEvent.DEPOSIT,
         "args": {
-            "participant": to_checksum_address(app0.raiden.address),
+            "participant": app0_address,
             "total_deposit": deposit,
             "channel_identifier": channel_id,
         },
@@ -353,14 +385,9 @@ def test_query_events(
 
     RaidenAPI(app0.raiden).channel_close(registry_address, token_address, app1.raiden.address)
 
-    all_netting_channel_events = get_all_netting_channel_events(
-        proxy_manager=app0.raiden.proxy_manager,
-        token_network_address=token_network_address,
-        netting_channel_identifier=channel_id,
-        contract_manager=app0.raiden.contract_manager,
-    )
-
-    closed_events = get_netting_channel_closed_events(
+    all_netting_channel_events, closed_events = query_events_concurrently(
+        get_new_netting_channel_events,
+        get_netting_channel_closed_events,
         proxy_manager=app0.raiden.proxy_manager,
         token_network_address=token_network_address,
         netting_channel_identifier=channel_id,
@@ -369,10 +396,7 @@ def test_query_events(
 
     closed_event = {
         "event": ChannelEvent.CLOSED,
-        "args": {
-            "channel_identifier": channel_id,
-            "closing_participant": to_checksum_address(app0.raiden.address),
-        },
+        "args": {"channel_identifier": channel_id, "closing_participant": app0_address},
     }
     assert must_have_event(closed_events, closed_event)
     assert must_have_event(all_netting_channel_events, closed_event)
@@ -380,14 +404,9 @@ def test_query_events(
     settle_expiration = app0.raiden.rpc_client.block_number() + settle_timeout + 5
     app0.raiden.proxy_manager.wait_until_block(target_block_number=settle_expiration)
 
-    all_netting_channel_events = get_all_netting_channel_events(
-        proxy_manager=app0.raiden.proxy_manager,
-        token_network_address=token_network_address,
-        netting_channel_identifier=channel_id,
-        contract_manager=app0.raiden.contract_manager,
-    )
-
-    settled_events = get_netting_channel_settled_events(
+    all_netting_channel_events, settled_events = query_events_concurrently(
+        get_new_netting_channel_events,
+        get_netting_channel_settled_events,
         proxy_manager=app0.raiden.proxy_manager,
         token_network_address=token_network_address,
         netting_channel_identifier=channel_id,
@@ -488,7 +507,7 @@ def test_clear_closed_queue(raiden_network, token_addresses, network_wait):
     token_address = token_addresses[0]
     chain_state0 = views.state_from_app(app0)
     token_network_address = views.get_token_network_address_by_token_address(
-        chain_state0, app0.raiden.default_registry.address, token_address
+        chain_state0, registry_address, token_address
     )
     assert token_network_address
     token_network = views.get_token_network_by_address(chain_state0, token_network_address)
@@ -502,8 +521,7 @@ def test_clear_closed_queue(raiden_network, token_addresses, network_wait):
     )
 
     target = app1.raiden.address
-    secret = sha3(target)
-    secrethash = sha256(secret).digest()
+    secret, secrethash = factories.make_secret_with_hash()
     hold_event_handler.hold_secretrequest_for(secrethash=secrethash)
 
     # make an unconfirmed transfer to ensure the nodes have communicated
@@ -335,10 +335,11 @@ def test_matrix_message_retry(
     # Retrier did not call send_raw given that the receiver is still offline
     assert transport._send_raw.call_count == 1
 
-    # Receiver comes back online
+    # Receiver comes back online, the retrier is woken up by the reachability change
     transport._address_mgr._address_to_reachability[
         partner_address
     ] = AddressReachability.REACHABLE
+    transport._address_reachability_changed(partner_address, AddressReachability.REACHABLE)
 
     # Retrier should send the message again
     with gevent.Timeout(retry_interval + 2):
@@ -103,6 +103,7 @@ def test_regression_transport_global_queues_are_initialized_on_restart_for_servi
 
     transport = MatrixTransport(app0.config["transport"]["matrix"])
     transport.send_async = Mock()
+    transport.send_async_many = Mock()
     transport._send_raw = Mock()
 
     old_start_transport = transport.start
@@ -5,11 +5,14 @@ import pytest
 
 from raiden.constants import EMPTY_SIGNATURE, UINT64_MAX
 from raiden.messages.transfers import SecretRequest
+from raiden.messages.withdraw import WithdrawExpired
 from raiden.network.transport import MatrixTransport
 from raiden.network.transport.matrix.client import GMatrixClient, Room
+from raiden.network.transport.matrix.transport import _RetryQueue
 from raiden.storage.serialization.serializer import MessageSerializer
 from raiden.tests.utils import factories
 from raiden.tests.utils.mocks import MockRaidenService
+from raiden.transfer.identifiers import QueueIdentifier
 from raiden.utils import Address
 from raiden.utils.signer import LocalSigner
 
@@ -66,10 +69,11 @@ def mock_matrix(monkeypatch, retry_interval, retries_before_backoff):
     ):
         pass
 
-    def mock_receive_message(klass, message):  # pylint: disable=unused-argument
+    def mock_receive_messages(klass, messages):  # pylint: disable=unused-argument
         # We are just unit testing the matrix transport receive so do nothing
-        assert message
-        assert message.sender
+        for message in messages:
+            assert message
+            assert message.sender
 
     config = dict(
         retry_interval=retry_interval,
@@ -92,7 +96,7 @@ def mock_matrix(monkeypatch, retry_interval, retries_before_backoff):
         MatrixTransport, "_get_room_ids_for_address", mock_get_room_ids_for_address
     )
     monkeypatch.setattr(MatrixTransport, "_set_room_id_for_address", mock_set_room_id_for_address)
-    monkeypatch.setattr(MatrixTransport, "_receive_message", mock_receive_message)
+    monkeypatch.setattr(MatrixTransport, "_receive_messages", mock_receive_messages)
 
     return transport
 
@@ -169,3 +173,29 @@ def test_processing_invalid_message_type_json(  # pylint: disable=unused-argumen
     invalid_message = '{"_type": "NonExistentMessage", "is": 3, "not_valid": 5}'
     room, event = make_message(overwrite_data=invalid_message)
     assert not mock_matrix._handle_message(room, event)
+
+
+def test_retry_queue_ignores_duplicated_unhashable_message(mock_matrix):
+    """ Messages without a hash (e.g. WithdrawExpired) must be enqueued and deduplicated """
+    retry_queue = _RetryQueue(transport=mock_matrix, receiver=factories.HOP1)
+    queue_identifier = QueueIdentifier(
+        recipient=factories.HOP1, canonical_identifier=factories.UNIT_CANONICAL_ID
+    )
+    message = WithdrawExpired(
+        message_identifier=1,
+        chain_id=factories.UNIT_CANONICAL_ID.chain_identifier,
+        token_network_address=factories.UNIT_CANONICAL_ID.token_network_address,
+        channel_identifier=factories.UNIT_CANONICAL_ID.channel_identifier,
+        participant=factories.HOP1,
+        total_withdraw=10,
+        expiration=10,
+        nonce=1,
+        signature=EMPTY_SIGNATURE,
+    )
+    message.sign(LocalSigner(factories.HOP1_KEY))
+    assert WithdrawExpired.__hash__ is None
+
+    retry_queue.enqueue(queue_identifier, message)
+    retry_queue.enqueue(queue_identifier, message)
+
+    assert len(retry_queue._message_queue) == 1
@@ -12,6 +12,7 @@ import raiden.network.transport.matrix.client
 import raiden.network.transport.matrix.utils
 from raiden.exceptions import TransportError
 from raiden.network.transport.matrix.utils import (
+    JOIN_RETRIES,
     join_global_room,
     login_or_register,
     make_client,
@@ -49,6 +50,44 @@ def test_join_global_room():
     assert room and isinstance(room, Room)
 
 
+def test_join_global_room_resolves_other_servers():
+    """ join_global_room should only join the room on servers where its alias resolves """
+    ownserver = "https://ownserver.com"
+    api = Mock()
+    api.base_url = ownserver
+    room_name = "raiden_ropsten_discovery"
+
+    def get_room_id(alias):
+        if alias == f"#{room_name}:resolving.server":
+            return "!room_id:resolving.server"
+        raise MatrixRequestError(404)
+
+    api.get_room_id = Mock(side_effect=get_room_id)
+
+    client = Mock()
+    client.api = api
+
+    def join_room(alias):
+        if alias == f"#{room_name}:ownserver.com":
+            raise MatrixRequestError(404)
+        room = Room(client, "!room_id:resolving.server")
+        room.add_room_alias = Mock()
+        return room
+
+    client.join_room = Mock(side_effect=join_room)
+
+    room = join_global_room(
+        client=client,
+        name=room_name,
+        servers=["https://unknown.server", "https://resolving.server"],
+    )
+    assert api.get_room_id.call_count == 2  # every other server is looked up
+    assert client.join_room.call_count == 2  # own server and the one which resolved
+    client.join_room.assert_called_with(f"#{room_name}:resolving.server")
+    client.create_room.assert_not_called()
+    assert f"#{room_name}:ownserver.com" in room.aliases
+
+
 def test_login_or_register_default_user():
     ownserver = "https://ownserver.com"
     api = Mock()
@@ -93,6 +132,31 @@ def test_login_or_register_default_user():
     )
 
 
+def test_login_or_register_stops_on_invalid_username():
+    """ Registration errors other than a taken username must not try further suffixes """
+    api = Mock()
+    api.base_url = "https://ownserver.com"
+
+    client = Mock()
+    client.api = api
+    client.login = Mock(side_effect=MatrixRequestError(403))
+    client.register_with_password = Mock(
+        side_effect=MatrixRequestError(400, '{"errcode": "M_INVALID_USERNAME"}')
+    )
+
+    with pytest.raises(MatrixRequestError):
+        login_or_register(client=client, signer=make_signer())
+    assert client.register_with_password.call_count == 1
+
+    client.register_with_password = Mock(
+        side_effect=MatrixRequestError(400, '{"errcode": "M_USER_IN_USE"}')
+    )
+
+    with pytest.raises(ValueError):
+        login_or_register(client=client, signer=make_signer())
+    assert client.register_with_password.call_count == JOIN_RETRIES
+
+
 def test_validate_userid_signature():
     ownserver = "https://ownserver.com"
     api = Mock()
@@ -37,6 +37,21 @@ def test_signature():
     assert ping.sender == ADDRESS
 
 
+def test_sender_follows_message_changes():
+    """ The recovered sender is cached, but must reflect later changes to the message """
+    ping = Ping(nonce=0, current_protocol_version=0, signature=EMPTY_SIGNATURE)
+    ping.sign(signer)
+    assert ping.sender == ADDRESS
+    assert ping.sender == ADDRESS
+
+    ping.sign(LocalSigner(PARTNER_PRIVKEY))
+    assert ping.sender == PARTNER_ADDRESS
+
+    # the signature doesn't match the changed data anymore
+    ping.nonce = 1
+    assert ping.sender != PARTNER_ADDRESS
+
+
 def test_request_monitoring() -> None:
     properties = factories.BalanceProofSignedStateProperties(pkey=PARTNER_PRIVKEY)
     balance_proof = factories.create(properties)
@@ -7,7 +7,9 @@ from eth_utils import to_canonical_address
 from networkx import Graph
 
 from raiden.exceptions import SerializationError
+from raiden.messages.synchronization import Processed
 from raiden.storage.serialization import JSONSerializer
+from raiden.storage.serialization.serializer import MessageSerializer
 from raiden.tests.utils import factories
 from raiden.transfer import state, state_change
 
@@ -36,6 +38,22 @@ def test_decode_with_unknown_type():
         JSONSerializer.deserialize(test_str)
 
 
+def test_message_serializer_serialize_many():
+    messages = [
+        Processed(message_identifier=message_identifier, signature=factories.EMPTY_SIGNATURE)
+        for message_identifier in range(3)
+    ]
+
+    text = MessageSerializer.serialize_many(messages)
+
+    assert text == "\n".join(MessageSerializer.serialize(message) for message in messages)
+    assert [MessageSerializer.deserialize(line) for line in text.split("\n")] == messages
+    assert MessageSerializer.serialize_many([]) == ""
+
+    duplicated = [messages[0], messages[1], messages[0], messages[2], messages[1]]
+    assert MessageSerializer.serialize_many(duplicated, unique=True) == text
+
+
 @pytest.mark.parametrize("input_value", ["[", b"\x00"])
 def test_deserialize_invalid_json(input_value):
     with pytest.raises(SerializationError):
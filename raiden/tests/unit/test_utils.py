@@ -1,16 +1,34 @@
 from datetime import timedelta
+from itertools import islice
 from unittest.mock import Mock, patch
 
 import pytest
 import requests
 from eth_keys.exceptions import BadSignature, ValidationError
-from eth_utils import decode_hex, to_canonical_address
-
-from raiden.constants import EMPTY_HASH
+from eth_utils import decode_hex, to_canonical_address, to_checksum_address
+
+from raiden.constants import (
+    DAI_TOKEN_ADDRESS,
+    EMPTY_HASH,
+    EMPTY_SECRET,
+    EMPTY_SECRET_SHA256,
+    LOCKSROOT_OF_NO_LOCKS,
+    NULL_ADDRESS,
+    NULL_ADDRESS_BYTES,
+    WETH_TOKEN_ADDRESS,
+)
 from raiden.exceptions import InvalidSignature
+from raiden.network.transport.matrix.transport import _RetryQueue
+from raiden.network.transport.utils import (
+    timeout_exponential_backoff,
+    timeout_exponential_backoff_schedule,
+    timeout_jitter,
+)
 from raiden.network.utils import get_http_rtt
 from raiden.tests.utils.mocks import MockWeb3
 from raiden.utils import block_specification_to_number, privatekey_to_publickey, sha3
+from raiden.utils.keccak import keccak
+from raiden.utils.secrethash import sha256_secrethash
 from raiden.utils.signer import LocalSigner, Signer, recover
 from raiden.utils.signing import pack_data
 from raiden.utils.typing import BlockNumber
@@ -103,3 +121,58 @@ def test_pack_data():
 
     with pytest.raises(TypeError):
         pack_data((256, "uint256"), ("This is not a uint256", "uint256"))
+
+
+def test_precomputed_address_constants():
+    assert to_canonical_address(NULL_ADDRESS) == NULL_ADDRESS_BYTES
+    assert to_checksum_address(NULL_ADDRESS_BYTES) == NULL_ADDRESS
+    assert WETH_TOKEN_ADDRESS == to_canonical_address("0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2")
+    assert DAI_TOKEN_ADDRESS == to_canonical_address("0x89d24A6b4CcB1B6fAA2625fE562bDD9a23260359")
+
+
+def test_precomputed_hash_constants():
+    assert EMPTY_SECRET_SHA256 == sha256_secrethash(EMPTY_SECRET)
+    assert LOCKSROOT_OF_NO_LOCKS == keccak(b"")
+
+
+def test_timeout_jitter():
+    timeouts = [0.1, 0.2, 0.4, 0.8, 10.0]
+    jittered = list(timeout_jitter(timeouts, 0.5))
+
+    assert len(jittered) == len(timeouts)
+    for timeout, jittered_timeout in zip(timeouts, jittered):
+        assert timeout * 0.5 <= jittered_timeout <= timeout * 1.5
+
+    assert list(timeout_jitter(timeouts, 0)) == timeouts
+
+    # the wrapped generator may be infinite
+    backoff = timeout_jitter(timeout_exponential_backoff(1, 1, 4), 0.1)
+    assert [round(next(backoff)) for _ in range(5)] == [1, 2, 4, 4, 4]
+
+
+@pytest.mark.parametrize(
+    "retries,timeout,maximum", [(0, 1, 8), (1, 1, 4), (3, 0.5, 10), (5, 2, 2), (2, 10, 4)]
+)
+def test_timeout_exponential_backoff_schedule(retries, timeout, maximum):
+    schedule = timeout_exponential_backoff_schedule(retries, timeout, maximum)
+    assert schedule[-1] == maximum
+
+    count = len(schedule) + 5
+    padded = list(schedule) + [maximum] * (count - len(schedule))
+    expected = list(islice(timeout_exponential_backoff(retries, timeout, maximum), count))
+    assert padded == expected
+
+
+def test_retry_queue_expiration():
+    now = 100.0
+    expiration = _RetryQueue._Expiration((1, 2, 4), now=lambda: now)
+
+    # the first value is always True, to send the message at least once
+    assert next(expiration) is True
+    for next_timeout in (1, 2, 4, 4):
+        previous = now
+        assert next(expiration) is False
+        now = previous + next_timeout / 2
+        assert next(expiration) is False
+        now = previous + next_timeout
+        assert next(expiration) is True
@@ -1,5 +1,4 @@
 import json
-import re
 from unittest.mock import patch
 
 import requests
@@ -146,13 +145,13 @@ def test_version_check_regex():
     text4 = "asd[CRITICAL UPDATE]"
     text5 = "Other text [CRITICAL UPDATE:>>>>>>>]><<<<asdeqsffqwe qwe sss."
     text6 = "\n\n[CRITICAL UPDATE: U+1F00 1F62D ❎ 😀] some text goes here."
-    assert re.search(SECURITY_EXPRESSION, text1).group(0) == "[CRITICAL UPDATE Some text.:)]"
-    assert re.search(SECURITY_EXPRESSION, text2) is None
-    assert re.search(SECURITY_EXPRESSION, text3) is None
-    assert re.search(SECURITY_EXPRESSION, text4).group(0) == "[CRITICAL UPDATE]"
-    assert re.search(SECURITY_EXPRESSION, text5).group(0) == "[CRITICAL UPDATE:>>>>>>>]"
-    assert re.search(SECURITY_EXPRESSION, text6).group(0) == "[CRITICAL UPDATE: U+1F00 1F62D ❎ 😀]"
-    assert re.search(SECURITY_EXPRESSION, text6).group(0) != "[CRITICAL UPDATE: U+1F00 1F62D ❎"
+    assert SECURITY_EXPRESSION.search(text1).group(0) == "[CRITICAL UPDATE Some text.:)]"
+    assert SECURITY_EXPRESSION.search(text2) is None
+    assert SECURITY_EXPRESSION.search(text3) is None
+    assert SECURITY_EXPRESSION.search(text4).group(0) == "[CRITICAL UPDATE]"
+    assert SECURITY_EXPRESSION.search(text5).group(0) == "[CRITICAL UPDATE:>>>>>>>]"
+    assert SECURITY_EXPRESSION.search(text6).group(0) == "[CRITICAL UPDATE: U+1F00 1F62D ❎ 😀]"
+    assert SECURITY_EXPRESSION.search(text6).group(0) != "[CRITICAL UPDATE: U+1F00 1F62D ❎"
 
 
 def test_version_check_api_rate_limit_exceeded():
@@ -1,5 +1,6 @@
 import os
 
+import gevent
 from solc import compile_files
 
 from raiden.network.pathfinding import get_random_pfs
@@ -61,8 +62,8 @@ def deploy_tokens_and_fund_accounts(
         proxy_manager: the proxy manager used to create the token proxy
         participants: participant addresses that will receive tokens
     """
-    result = list()
-    for _ in range(number_of_tokens):
+
+    def deploy_and_fund_token() -> TokenAddress:
         token_address = TokenAddress(
             deploy_contract_web3(
                 contract_name=token_contract_name,
@@ -72,8 +73,6 @@ def deploy_tokens_and_fund_accounts(
             )
         )
 
-        result.append(token_address)
-
         # only the creator of the token starts with a balance (deploy_service),
         # transfer from the creator to the other nodes
         for transfer_to in participants:
@@ -81,7 +80,14 @@ def deploy_tokens_and_fund_accounts(
                 to_address=transfer_to, amount=TokenAmount(token_amount // len(participants))
             )
 
-    return result
+        return token_address
+
+    # The tokens are independent, deploying them concurrently lets their
+    # transactions share the mining and confirmation waits.
+    greenlets = [gevent.spawn(deploy_and_fund_token) for _ in range(number_of_tokens)]
+    gevent.joinall(greenlets, raise_error=True)
+
+    return [greenlet.get() for greenlet in greenlets]
 
 
 def deploy_service_registry_and_set_urls(
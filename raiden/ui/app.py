@@ -11,17 +11,12 @@ from web3 import HTTPProvider, Web3
 
 from raiden.accounts import AccountManager
 from raiden.constants import (
+    FORKS,
     GENESIS_BLOCK_NUMBER,
     MONITORING_BROADCASTING_ROOM,
     PATH_FINDING_BROADCASTING_ROOM,
     RAIDEN_DB_VERSION,
     Environment,
-    EthereumForks,
-    GoerliForks,
-    KovanForks,
-    Networks,
-    RinkebyForks,
-    RopstenForks,
     RoutingMode,
 )
 from raiden.exceptions import RaidenError
@@ -122,20 +117,12 @@ def get_account_and_private_key(
 
 
 def get_smart_contracts_start_at(network_id: ChainID) -> BlockNumber:
-    if network_id == Networks.MAINNET:
-        smart_contracts_start_at = EthereumForks.CONSTANTINOPLE.value
-    elif network_id == Networks.ROPSTEN:
-        smart_contracts_start_at = RopstenForks.CONSTANTINOPLE.value
-    elif network_id == Networks.KOVAN:
-        smart_contracts_start_at = KovanForks.CONSTANTINOPLE.value
-    elif network_id == Networks.RINKEBY:
-        smart_contracts_start_at = RinkebyForks.CONSTANTINOPLE.value
-    elif network_id == Networks.GOERLI:
-        smart_contracts_start_at = GoerliForks.CONSTANTINOPLE.value
-    else:
-        smart_contracts_start_at = GENESIS_BLOCK_NUMBER
+    forks = FORKS.get(network_id)
+
+    if forks is None:
+        return GENESIS_BLOCK_NUMBER
 
-    return smart_contracts_start_at
+    return forks["CONSTANTINOPLE"]
 
 
 def rpc_normalized_endpoint(eth_rpc_endpoint: str) -> str:
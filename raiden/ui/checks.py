@@ -34,7 +34,11 @@ def check_sql_version() -> None:
     if not assert_sqlite_version():
         log.error(
             "SQLite3 should be at least version {}".format(
-                "{}.{}.{}".format(*SQLITE_MIN_REQUIRED_VERSION)
+                "{}.{}.{}".format(
+                    SQLITE_MIN_REQUIRED_VERSION // 1_000_000,
+                    SQLITE_MIN_REQUIRED_VERSION // 1_000 % 1_000,
+                    SQLITE_MIN_REQUIRED_VERSION % 1_000,
+                )
             )
         )
         sys.exit(1)
@@ -0,0 +1,32 @@
+import hashlib
+
+from raiden.utils.typing import Callable
+
+
+def _load_keccak() -> Callable[[bytes], bytes]:
+    """Return the fastest available keccak256 implementation.
+
+    `eth_utils.keccak` validates its arguments and dispatches to the `eth_hash`
+    backend on every call, so it is only used if neither OpenSSL nor pysha3
+    provide keccak.
+    """
+    try:
+        hashlib.new("keccak-256")
+    except ValueError:
+        pass
+    else:
+        return lambda data: hashlib.new("keccak-256", data).digest()
+
+    try:
+        from sha3 import keccak_256
+    except ImportError:
+        pass
+    else:
+        return lambda data: keccak_256(data).digest()
+
+    from eth_utils import keccak as eth_utils_keccak
+
+    return eth_utils_keccak
+
+
+keccak = _load_keccak()
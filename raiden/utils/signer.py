@@ -3,9 +3,10 @@ from typing import Callable
 
 from eth_keys import keys
 from eth_keys.exceptions import BadSignature, ValidationError
-from eth_utils import keccak, to_checksum_address
+from eth_utils import to_checksum_address
 
 from raiden.exceptions import InvalidSignature
+from raiden.utils.keccak import keccak
 from raiden.utils.typing import Address, AddressHex, Signature
 
 
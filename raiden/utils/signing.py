@@ -1,10 +1,12 @@
 from typing import Any, Tuple
 
-from eth_utils import decode_hex, keccak, remove_0x_prefix
+from eth_utils import decode_hex, remove_0x_prefix
 from web3.utils.abi import map_abi_data
 from web3.utils.encoding import hex_encode_abi_type
 from web3.utils.normalizers import abi_address_to_hex
 
+from raiden.utils.keccak import keccak
+
 sha3 = keccak
 
 